@@ -186,6 +186,12 @@ class AlterStatementGenerator:
                 report_lines.append(f"  {i}. Index ADDED: {diff.get('index_name', 'unknown')}")
             elif diff_type == ChangeType.REMOVE_INDEX.value:
                 report_lines.append(f"  {i}. Index REMOVED: {diff.get('index_name', 'unknown')}")
+            elif diff_type == ChangeType.MODIFY_INDEX.value:
+                report_lines.append(f"  {i}. Index MODIFIED: {diff.get('index_name', 'unknown')}")
+                if diff.get('original_definition'):
+                    report_lines.append(f"      FROM: {diff['original_definition']}")
+                if diff.get('new_definition'):
+                    report_lines.append(f"      TO:   {diff['new_definition']}")
             elif diff_type == ChangeType.ADD_CONSTRAINT.value:
                 report_lines.append(f"  {i}. Foreign Key ADDED: {diff.get('constraint_name', 'unknown')}")
             elif diff_type == ChangeType.REMOVE_CONSTRAINT.value:
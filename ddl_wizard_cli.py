@@ -35,10 +35,10 @@ import time
 from pathlib import Path
 from typing import Dict, List
 
-from database import DatabaseManager, DatabaseConfig
 from config_manager import DDLWizardConfig
-from interactive_mode import InteractiveModeManager
-from ddl_wizard_core import DDLWizardCore, run_complete_migration
+
+# The database, core and reporting modules are imported inside the mode functions
+# that use them, so --help and history mode start without loading them
 
 # Set up logging
 logging.basicConfig(
@@ -200,6 +200,9 @@ def extract_mode(config: DDLWizardConfig, args: argparse.Namespace):
         sys.exit(1)
     
     try:
+        from database import DatabaseConfig
+        from ddl_wizard_core import DDLWizardCore
+        
         # Create core instance
         core = DDLWizardCore(config)
         
@@ -247,6 +250,9 @@ def visualize_mode(config: DDLWizardConfig, args: argparse.Namespace):
         sys.exit(1)
     
     try:
+        from database import DatabaseConfig
+        from ddl_wizard_core import DDLWizardCore
+        
         # Create core instance
         core = DDLWizardCore(config)
         
@@ -293,32 +299,39 @@ def history_mode(config: DDLWizardConfig, args: argparse.Namespace):
             print("No migration history found.")
             return
         
-        print(f"\nMigration History (Last {len(migrations)} migrations):")
-        print("-" * 80)
-        
-        for migration in migrations:
-            print(f"ID: {migration['id']}")
-            print(f"Name: {migration['migration_name']}")
-            print(f"Source: {migration['source_schema']} → Destination: {migration['destination_schema']}")
-            print(f"Status: {migration['status']}")
-            print(f"Operations: {migration['operation_count']}")
-            print(f"Started: {migration['start_time']}")
-            if migration['end_time']:
-                print(f"Completed: {migration['end_time']}")
-            print("-" * 80)
+        separator = "-" * 80
+        format_record = (
+            "ID: {}\n"
+            "Name: {}\n"
+            "Source: {} → Destination: {}\n"
+            "Status: {}\n"
+            "Operations: {}\n"
+            "Executed: {} ({:.2f}s)\n" + separator
+        ).format
+        
+        # Build the whole listing and write it once rather than printing line by line
+        sys.stdout.write("\n".join([
+            f"\nMigration History (Last {len(migrations)} migrations):",
+            separator,
+            *(format_record(m.id, m.migration_name, m.source_schema, m.destination_schema,
+                            m.status, m.operations_count, m.executed_at, m.execution_time)
+              for m in migrations)
+        ]))
+        sys.stdout.write("\n")
         
         # Show summary statistics
         from collections import Counter
         
-        statuses = [m['status'] for m in migrations]
+        statuses = [m.status for m in migrations]
         status_counts = Counter(statuses)
         
-        print(f"\nSummary:")
-        for status, count in status_counts.items():
-            print(f"{status}: {count}")
-        
         success_rate = (status_counts.get('SUCCESS', 0) / len(migrations)) * 100 if migrations else 0
-        print(f"Success rate: {success_rate:.1f}%")
+        sys.stdout.write("\n".join([
+            "\nSummary:",
+            *(f"{status}: {count}" for status, count in status_counts.items()),
+            f"Success rate: {success_rate:.1f}%"
+        ]) + "\n")
+        sys.stdout.flush()
         
     except Exception as e:
         logger.error(f"History mode failed: {e}")
@@ -333,6 +346,9 @@ def compare_mode(config: DDLWizardConfig, args: argparse.Namespace):
         logger.error("Both source and destination database configurations required for compare mode")
         sys.exit(1)
     
+    from database import DatabaseConfig
+    from ddl_wizard_core import run_complete_migration
+    
     # Create database configurations
     source_config = DatabaseConfig(
         host=config.source.host,
@@ -375,18 +391,22 @@ def compare_mode(config: DDLWizardConfig, args: argparse.Namespace):
             for warning in results['safety_warnings']:
                 logger.warning(f"  {warning.level.value}: {warning.message}")
                 
-        print(f"\n✅ Schema comparison and migration generation completed successfully!")
-        print(f"Migration ID: {results['migration_id']}")
-        print(f"Operations: {results['operation_count']}")
-        print(f"Safety warnings: {len(results['safety_warnings'])}")
-        print(f"Migration file: {results['migration_file']}")
-        print(f"Rollback file: {results['rollback_file']}")
-        print(f"Migration report: {results['migration_report_file']}")
-        
         if getattr(args, 'dry_run', False):
-            print("✅ Dry run completed successfully!")
+            completion = "✅ Dry run completed successfully!"
         else:
-            print("✅ Migration analysis completed successfully!")
+            completion = "✅ Migration analysis completed successfully!"
+        
+        sys.stdout.write("\n".join([
+            "\n✅ Schema comparison and migration generation completed successfully!",
+            f"Migration ID: {results['migration_id']}",
+            f"Operations: {results['operation_count']}",
+            f"Safety warnings: {len(results['safety_warnings'])}",
+            f"Migration file: {results['migration_file']}",
+            f"Rollback file: {results['rollback_file']}",
+            f"Migration report: {results['migration_report_file']}",
+            completion
+        ]) + "\n")
+        sys.stdout.flush()
             
     except Exception as e:
         logger.error(f"Migration failed: {e}")
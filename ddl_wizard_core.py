@@ -23,15 +23,18 @@ Core functionality for DDL Wizard that can be used by both CLI and GUI interface
 This module contains the main business logic for schema comparison and migration generation.
 """
 
+import atexit
+import hashlib
 import logging
-import time
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 
 from database import DatabaseManager, DatabaseConfig
 from git_manager import GitManager
-from schema_comparator import SchemaComparator
+from schema_comparator import SchemaComparator, same_ddl_ignoring_whitespace
 from alter_generator import AlterStatementGenerator
 from config_manager import DDLWizardConfig
 from safety_analyzer import SafetyAnalyzer
@@ -41,6 +44,31 @@ from schema_visualizer import SchemaVisualizer, generate_migration_report
 
 logger = logging.getLogger(__name__)
 
+# Output buffer size used when streaming SQL scripts to disk
+SQL_WRITE_BUFFER = 1 << 20
+
+# DDL getter for each object type, resolved once instead of per lookup
+_DDL_GETTERS = {
+    'tables': DatabaseManager.get_table_ddl,
+    'views': DatabaseManager.get_view_ddl,
+    'functions': DatabaseManager.get_function_ddl,
+    'procedures': DatabaseManager.get_procedure_ddl,
+    'triggers': DatabaseManager.get_trigger_ddl,
+    'events': DatabaseManager.get_event_ddl,
+    'sequences': DatabaseManager.get_sequence_ddl,
+}
+
+# Report object types (singular) mapped to their comparison result keys
+_OBJECT_TYPE_KEYS = {
+    'table': 'tables',
+    'view': 'views',
+    'procedure': 'procedures',
+    'function': 'functions',
+    'trigger': 'triggers',
+    'event': 'events',
+    'sequence': 'sequences',
+}
+
 
 class DDLWizardCore:
     """Core DDL Wizard functionality that can be used by both CLI and GUI."""
@@ -57,6 +85,9 @@ class DDLWizardCore:
         self.dependency_manager = None  # Will be initialized when we have database connections
         self.history = MigrationHistory()
         self.visualizer = SchemaVisualizer()
+        # (object_type, object_name) -> DDL, so each object is fetched at most once
+        self._source_ddl_cache: Dict[Tuple[str, str], str] = {}
+        self._dest_ddl_cache: Dict[Tuple[str, str], str] = {}
     
     def connect_databases(self, source_config: DatabaseConfig, dest_config: DatabaseConfig) -> bool:
         """
@@ -72,8 +103,12 @@ class DDLWizardCore:
         try:
             logger.info("Connecting to databases...")
             
+            # Release the pooled connections of a previous connect before replacing them
+            self.close_databases()
             self.source_db = DatabaseManager(source_config)
             self.dest_db = DatabaseManager(dest_config)
+            self._source_ddl_cache.clear()
+            self._dest_ddl_cache.clear()
             
             # Initialize alter generator with destination schema
             self.alter_generator = AlterStatementGenerator(dest_config.schema)
@@ -97,6 +132,12 @@ class DDLWizardCore:
             logger.error(f"Database connection error: {e}")
             return False
     
+    def close_databases(self):
+        """Close the idle pooled connections of both database managers."""
+        for db in (self.source_db, self.dest_db):
+            if db is not None:
+                db.close()
+    
     def initialize_git_repository(self, output_dir: str) -> bool:
         """
         Initialize git repository for migration tracking.
@@ -128,8 +169,14 @@ class DDLWizardCore:
             raise ValueError("Databases not connected. Call connect_databases() first.")
         
         logger.info("Extracting DDL objects...")
-        source_objects = self.source_db.get_all_objects_with_ddl()
-        dest_objects = self.dest_db.get_all_objects_with_ddl()
+        # The two databases are independent, so extract them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            source_future = executor.submit(self.source_db.get_all_objects_with_ddl)
+            dest_future = executor.submit(self.dest_db.get_all_objects_with_ddl)
+            source_objects = source_future.result()
+            dest_objects = dest_future.result()
+        self._seed_ddl_cache(self._source_ddl_cache, source_objects)
+        self._seed_ddl_cache(self._dest_ddl_cache, dest_objects)
         
         # Save DDL objects to files for comparison
         if self.git_manager:
@@ -141,22 +188,32 @@ class DDLWizardCore:
         return source_objects, dest_objects
     
     def _get_source_ddl(self, object_type: str, object_name: str) -> str:
-        """Get DDL for a source database object."""
-        if object_type == 'tables':
-            return self.source_db.get_table_ddl(object_name)
-        elif object_type == 'views':
-            return self.source_db.get_view_ddl(object_name)
-        elif object_type == 'functions':
-            return self.source_db.get_function_ddl(object_name)
-        elif object_type == 'procedures':
-            return self.source_db.get_procedure_ddl(object_name)
-        elif object_type == 'triggers':
-            return self.source_db.get_trigger_ddl(object_name)
-        elif object_type == 'events':
-            return self.source_db.get_event_ddl(object_name)
-        elif object_type == 'sequences':
-            return self.source_db.get_sequence_ddl(object_name)
-        return ""
+        """Get DDL for a source database object (fetched at most once per run)."""
+        key = (object_type, object_name)
+        ddl = self._source_ddl_cache.get(key)
+        if ddl is None:
+            ddl = self._source_ddl_cache[key] = self._fetch_ddl(self.source_db, object_type, object_name)
+        return ddl
+    
+    def _get_dest_ddl(self, object_type: str, object_name: str) -> str:
+        """Get DDL for a destination database object (fetched at most once per run)."""
+        key = (object_type, object_name)
+        ddl = self._dest_ddl_cache.get(key)
+        if ddl is None:
+            ddl = self._dest_ddl_cache[key] = self._fetch_ddl(self.dest_db, object_type, object_name)
+        return ddl
+    
+    def _fetch_ddl(self, db: DatabaseManager, object_type: str, object_name: str) -> str:
+        """Fetch DDL for an object from the database."""
+        getter = _DDL_GETTERS.get(object_type)
+        return getter(db, object_name) if getter else ""
+    
+    def _seed_ddl_cache(self, cache: Dict[Tuple[str, str], str], objects: Dict):
+        """Store the DDL already returned by get_all_objects_with_ddl()."""
+        for object_type, object_list in objects.items():
+            for obj in object_list:
+                if obj.get('ddl'):
+                    cache[(object_type, obj['name'])] = obj['ddl']
     
     def compare_schemas(self, source_objects: Dict, dest_objects: Dict) -> Dict:
         """
@@ -172,6 +229,31 @@ class DDLWizardCore:
         logger.info("Comparing schemas...")
         return self.comparator.compare_objects(source_objects, dest_objects)
     
+    def schema_fingerprints(self, source_objects: Dict, dest_objects: Dict) -> Tuple[bytes, bytes]:
+        """
+        Fingerprint the objects and DDL of both schemas.
+        
+        Args:
+            source_objects: Source database objects
+            dest_objects: Destination database objects
+            
+        Returns:
+            Tuple[bytes, bytes]: Source and destination fingerprints, equal when both
+            schemas contain the same objects with identical DDL
+        """
+        return (self._schema_fingerprint(source_objects, self._get_source_ddl),
+                self._schema_fingerprint(dest_objects, self._get_dest_ddl))
+    
+    @staticmethod
+    def _schema_fingerprint(objects: Dict, get_ddl: Any) -> bytes:
+        """Hash every object type, name and DDL of a schema in a stable order."""
+        digest = hashlib.blake2b()
+        for object_type in sorted(objects):
+            for obj in sorted(objects[object_type], key=lambda o: o['name']):
+                ddl = obj.get('ddl') or get_ddl(object_type, obj['name']) or ''
+                digest.update(f"{object_type}\0{obj['name']}\0{ddl}\0".encode())
+        return digest.digest()
+    
     def perform_safety_analysis(self, migration_operations: List[Dict]) -> List[Any]:
         """
         Perform safety analysis on migration operations.
@@ -196,118 +278,47 @@ class DDLWizardCore:
         
         return safety_warnings
     
-    def generate_migration_sql(self, comparison: Dict, source_config: DatabaseConfig, dest_config: DatabaseConfig) -> str:
+    def write_migration_sql(self, path: Path, comparison: Dict, source_config: DatabaseConfig, dest_config: DatabaseConfig):
         """
-        Generate migration SQL from comparison results.
+        Generate migration SQL from comparison results and stream it to a file.
         
         Args:
+            path: Migration script to write
             comparison: Schema comparison results
             source_config: Source database configuration
             dest_config: Destination database configuration
-            
-        Returns:
-            str: Generated migration SQL
         """
-        def get_source_ddl(object_type: str, object_name: str) -> str:
-            if object_type == 'tables':
-                return self.source_db.get_table_ddl(object_name)
-            elif object_type == 'views':
-                return self.source_db.get_view_ddl(object_name)
-            elif object_type == 'functions':
-                return self.source_db.get_function_ddl(object_name)
-            elif object_type == 'procedures':
-                return self.source_db.get_procedure_ddl(object_name)
-            elif object_type == 'triggers':
-                return self.source_db.get_trigger_ddl(object_name)
-            elif object_type == 'events':
-                return self.source_db.get_event_ddl(object_name)
-            elif object_type == 'sequences':
-                return self.source_db.get_sequence_ddl(object_name)
-            return ""
-        
-        def get_dest_ddl(object_type: str, object_name: str) -> str:
-            if object_type == 'tables':
-                return self.dest_db.get_table_ddl(object_name)
-            elif object_type == 'views':
-                return self.dest_db.get_view_ddl(object_name)
-            elif object_type == 'functions':
-                return self.dest_db.get_function_ddl(object_name)
-            elif object_type == 'procedures':
-                return self.dest_db.get_procedure_ddl(object_name)
-            elif object_type == 'triggers':
-                return self.dest_db.get_trigger_ddl(object_name)
-            elif object_type == 'events':
-                return self.dest_db.get_event_ddl(object_name)
-            elif object_type == 'sequences':
-                return self.dest_db.get_sequence_ddl(object_name)
-            return ""
-        
         logger.info("Generating migration SQL...")
-        return self.comparator.generate_migration_sql(
-            comparison, get_source_ddl, get_dest_ddl,
-            source_config.schema, dest_config.schema
-        )
+        with path.open('w', buffering=SQL_WRITE_BUFFER) as f:
+            self.comparator.write_migration_sql(
+                f, comparison, self._get_source_ddl, self._get_dest_ddl,
+                source_config.schema, dest_config.schema
+            )
     
-    def generate_rollback_sql(self, comparison: Dict, source_objects: Dict, dest_objects: Dict) -> str:
+    def write_rollback_sql(self, path: Path, comparison: Dict, source_objects: Dict, dest_objects: Dict):
         """
-        Generate rollback SQL from comparison results.
+        Generate rollback SQL from comparison results and stream it to a file.
         
         Args:
+            path: Rollback script to write
             comparison: Schema comparison results
             source_objects: Source database objects
             dest_objects: Destination database objects
-            
-        Returns:
-            str: Generated rollback SQL
         """
-        def get_source_ddl(object_type: str, object_name: str) -> str:
-            if object_type == 'tables':
-                return self.source_db.get_table_ddl(object_name)
-            elif object_type == 'views':
-                return self.source_db.get_view_ddl(object_name)
-            elif object_type == 'functions':
-                return self.source_db.get_function_ddl(object_name)
-            elif object_type == 'procedures':
-                return self.source_db.get_procedure_ddl(object_name)
-            elif object_type == 'triggers':
-                return self.source_db.get_trigger_ddl(object_name)
-            elif object_type == 'events':
-                return self.source_db.get_event_ddl(object_name)
-            elif object_type == 'sequences':
-                return self.source_db.get_sequence_ddl(object_name)
-            return ""
-        
-        def get_dest_ddl(object_type: str, object_name: str) -> str:
-            if object_type == 'tables':
-                return self.dest_db.get_table_ddl(object_name)
-            elif object_type == 'views':
-                return self.dest_db.get_view_ddl(object_name)
-            elif object_type == 'functions':
-                return self.dest_db.get_function_ddl(object_name)
-            elif object_type == 'procedures':
-                return self.dest_db.get_procedure_ddl(object_name)
-            elif object_type == 'triggers':
-                return self.dest_db.get_trigger_ddl(object_name)
-            elif object_type == 'events':
-                return self.dest_db.get_event_ddl(object_name)
-            elif object_type == 'sequences':
-                return self.dest_db.get_sequence_ddl(object_name)
-            return ""
-        
         # Import the rollback generation function from main module
         from ddl_wizard import generate_detailed_rollback_sql
         
         # Generate rollback operations
         rollback_operations = self.dependency_manager.generate_rollback_operations([])
-        rollback_sql_lines = [op['sql'] for op in rollback_operations]
         
-        # Add detailed rollback for schema changes
-        rollback_sql_lines.extend(generate_detailed_rollback_sql(
-            comparison, source_objects, dest_objects, 
-            self.alter_generator, get_source_ddl, get_dest_ddl
-        ))
-        
-        return "\n".join(rollback_sql_lines)
+        with path.open('w', buffering=SQL_WRITE_BUFFER) as f:
+            f.writelines(f"{op['sql']}\n" for op in rollback_operations)
+            
+            # Add detailed rollback for schema changes, written line by line as it is generated
+            f.writelines(f"{line}\n" for line in generate_detailed_rollback_sql(
+                comparison, source_objects, dest_objects, 
+                self.alter_generator, self._get_source_ddl, self._get_dest_ddl
+            ))
     
     def generate_migration_report(self, comparison: Dict, safety_warnings: List[Any], 
                                 source_config: DatabaseConfig, dest_config: DatabaseConfig) -> Dict:
@@ -323,39 +334,8 @@ class DDLWizardCore:
         Returns:
             Dict: Migration report data
         """
-        def get_source_ddl(object_type: str, object_name: str) -> str:
-            if object_type == 'tables':
-                return self.source_db.get_table_ddl(object_name)
-            elif object_type == 'views':
-                return self.source_db.get_view_ddl(object_name)
-            elif object_type == 'functions':
-                return self.source_db.get_function_ddl(object_name)
-            elif object_type == 'procedures':
-                return self.source_db.get_procedure_ddl(object_name)
-            elif object_type == 'triggers':
-                return self.source_db.get_trigger_ddl(object_name)
-            elif object_type == 'events':
-                return self.source_db.get_event_ddl(object_name)
-            elif object_type == 'sequences':
-                return self.source_db.get_sequence_ddl(object_name)
-            return ""
-        
-        def get_dest_ddl(object_type: str, object_name: str) -> str:
-            if object_type == 'tables':
-                return self.dest_db.get_table_ddl(object_name)
-            elif object_type == 'views':
-                return self.dest_db.get_view_ddl(object_name)
-            elif object_type == 'functions':
-                return self.dest_db.get_function_ddl(object_name)
-            elif object_type == 'procedures':
-                return self.dest_db.get_procedure_ddl(object_name)
-            elif object_type == 'triggers':
-                return self.dest_db.get_trigger_ddl(object_name)
-            elif object_type == 'events':
-                return self.dest_db.get_event_ddl(object_name)
-            elif object_type == 'sequences':
-                return self.dest_db.get_sequence_ddl(object_name)
-            return ""
+        get_source_ddl = self._get_source_ddl
+        get_dest_ddl = self._get_dest_ddl
         
         # Generate migration report data from comparison results
         detailed_changes = []
@@ -431,9 +411,7 @@ class DDLWizardCore:
                 try:
                     source_ddl = get_source_ddl('procedures', proc_name)
                     dest_ddl = get_dest_ddl('procedures', proc_name)
-                    source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                    dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                    if source_normalized != dest_normalized:
+                    if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl):
                         detailed_changes.append({
                             'type': 'PROCEDURE',
                             'object_type': 'procedure',
@@ -473,9 +451,7 @@ class DDLWizardCore:
                 try:
                     source_ddl = get_source_ddl('functions', func_name)
                     dest_ddl = get_dest_ddl('functions', func_name)
-                    source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                    dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                    if source_normalized != dest_normalized:
+                    if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl):
                         detailed_changes.append({
                             'type': 'FUNCTION',
                             'object_type': 'function',
@@ -515,9 +491,7 @@ class DDLWizardCore:
                 try:
                     source_ddl = get_source_ddl('views', view_name)
                     dest_ddl = get_dest_ddl('views', view_name)
-                    source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                    dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                    if source_normalized != dest_normalized:
+                    if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl):
                         detailed_changes.append({
                             'type': 'VIEW',
                             'object_type': 'view',
@@ -537,7 +511,8 @@ class DDLWizardCore:
             'comparison_data': comparison  # Include full comparison data for detailed reporting
         }
     
-    def generate_schema_visualization(self, source_objects: Dict, dest_objects: Dict, comparison: Dict, output_dir: str):
+    def generate_schema_visualization(self, source_objects: Dict, dest_objects: Dict, comparison: Dict, output_dir: str,
+                                      background: bool = False) -> Optional[multiprocessing.Process]:
         """
         Generate schema visualization files including dependency analysis.
         
@@ -546,23 +521,40 @@ class DDLWizardCore:
             dest_objects: Destination database objects  
             comparison: Schema comparison results
             output_dir: Output directory for visualization files
+            background: Render in a separate process, joined at interpreter exit, and return it
+                instead of waiting
+            
+        Returns:
+            Optional[multiprocessing.Process]: The rendering process when background is set
         """
         logger.info("Generating schema visualizations...")
         
-        # Create schema data structure
+        # Create schema data structure from the DDL extracted alongside each object
         schema_data = {}
         if 'tables' in source_objects:
-            schema_data['tables'] = {}
-            for table_obj in source_objects['tables']:
-                table_name = table_obj['name']
-                schema_data['tables'][table_name] = self.source_db.get_table_ddl(table_name)
+            schema_data['tables'] = {
+                table_obj['name']: table_obj.get('ddl') or self._get_source_ddl('tables', table_obj['name'])
+                for table_obj in source_objects['tables']
+            }
+        
+        visualization_output_dir = Path(output_dir) / "documentation"
+        if background:
+            # Spawned rather than forked so the worker inherits no database connections or
+            # locks; it only receives the plain schema data and rebuilds its own visualizer
+            process = multiprocessing.get_context("spawn").Process(
+                target=_render_documentation, args=(schema_data, str(visualization_output_dir)),
+                name="ddl-wizard-documentation"
+            )
+            process.start()
+            atexit.register(_join_documentation, process)
+            return process
         
         # Analyze and generate visualizations
         self.visualizer.analyze_schema(schema_data)
-        visualization_output_dir = Path(output_dir) / "documentation"
         self.visualizer.export_documentation(str(visualization_output_dir))
         
         logger.info(f"Schema visualizations generated in {visualization_output_dir}")
+        return None
         
         # Note: Dependency analysis is handled by the schema visualizer with migration report
         # The visualizer already calls the dependency analyzer with both source and destination objects
@@ -570,7 +562,7 @@ class DDLWizardCore:
     def record_migration_history(self, migration_name: str, source_config: DatabaseConfig, 
                                dest_config: DatabaseConfig, operation_count: int, 
                                migration_file: str, rollback_file: str, 
-                               warning_count: int) -> int:
+                               warning_count: int, detailed_changes: List[Dict] = None) -> int:
         """
         Record migration in history.
         
@@ -582,6 +574,7 @@ class DDLWizardCore:
             migration_file: Path to migration file
             rollback_file: Path to rollback file
             warning_count: Number of warnings
+            detailed_changes: Per-object changes from the migration report, recorded as operations
             
         Returns:
             int: Migration ID
@@ -591,38 +584,42 @@ class DDLWizardCore:
             operation_count, migration_file, rollback_file, warning_count
         )
         
+        if detailed_changes:
+            self.history.record_operations(migration_id, [
+                {
+                    'operation_type': f"{change['operation']} {change['type']}",
+                    'table_name': change['object_name'],
+                    'sql_statement': change['sql']
+                }
+                for change in detailed_changes
+            ])
+        
         self.history.complete_migration(migration_id, "SUCCESS", 0.0, operation_count, 0, "Migration completed successfully")
         logger.info(f"Migration tracking completed: {migration_id}")
         
         return migration_id
     
-    def write_migration_files(self, migration_sql: str, rollback_sql: str, 
-                            migration_report_data: Dict, output_dir: str,
-                            comparison: Dict = None, source_objects: Dict = None) -> Tuple[str, str, str]:
+    def write_migration_report(self, migration_report_data: Dict, migration_file: str, output_dir: str,
+                               comparison: Dict = None, source_objects: Dict = None) -> str:
         """
-        Write migration files to disk.
+        Write the migration report and summary to disk.
         
         Args:
-            migration_sql: Migration SQL content
-            rollback_sql: Rollback SQL content
             migration_report_data: Migration report data
+            migration_file: Migration script already written to disk
             output_dir: Output directory
             comparison: Schema comparison results (for enhanced reporting)
             source_objects: Source database objects (for dependency analysis)
             
         Returns:
-            Tuple[str, str, str]: Paths to migration file, rollback file, migration report
+            str: Path to the migration report
         """
         output_path = Path(output_dir)
-        
-        # Write migration files
-        migration_file = output_path / self.config.output.migration_file
-        rollback_file = output_path / self.config.output.rollback_file
         migration_report_path = output_path / "migration_report.md"
         migration_summary_path = output_path / "migration_summary.txt"
         
-        migration_file.write_text(migration_sql)
-        rollback_file.write_text(rollback_sql)
+        # The data loss analysis works on the complete script, read back from disk
+        migration_sql = Path(migration_file).read_text()
         
         # Generate migration report with enhanced analysis
         if comparison is not None and source_objects is not None:
@@ -638,7 +635,7 @@ class DDLWizardCore:
         comparison_summary = self._generate_comparison_summary(migration_report_data)
         migration_summary_path.write_text(comparison_summary)
         
-        return str(migration_file), str(rollback_file), str(migration_report_path)
+        return str(migration_report_path)
     
     def _generate_comparison_summary(self, migration_report_data: Dict) -> str:
         """Generate a detailed text summary of the comparison with tabular format."""
@@ -675,13 +672,10 @@ class DDLWizardCore:
             # Group changes by object type for better reporting
             object_types = {}
             for change in changes:
-                change_type = change.get('operation', 'unknown')
-                object_name = change.get('object_name', 'unknown')
-                object_type = change.get('object_type', 'unknown')
-                
-                if object_type not in object_types:
-                    object_types[object_type] = []
-                object_types[object_type].append(f"{change_type}: {object_name}")
+                get = change.get
+                object_types.setdefault(get('object_type', 'unknown'), []).append(
+                    f"{get('operation', 'unknown')}: {get('object_name', 'unknown')}"
+                )
             
             # Add detailed reporting for each object type
             for obj_type, changes_list in object_types.items():
@@ -726,30 +720,19 @@ class DDLWizardCore:
         operation_counts = {}
         if detailed_changes:
             for change in detailed_changes:
-                operation = change.get('operation', 'unknown')
-                obj_type = change.get('object_type', 'unknown').lower()
+                get = change.get
+                operation = get('operation', 'unknown')
+                obj_type = get('object_type', 'unknown').lower()
                 
                 # Normalize object type names to match comparison_data keys
-                if obj_type == 'table':
-                    obj_type = 'tables'
-                elif obj_type == 'view':
-                    obj_type = 'views'
-                elif obj_type == 'procedure':
-                    obj_type = 'procedures'
-                elif obj_type == 'function':
-                    obj_type = 'functions'
-                elif obj_type == 'trigger':
-                    obj_type = 'triggers'
-                elif obj_type == 'event':
-                    obj_type = 'events'
-                elif obj_type == 'sequence':
-                    obj_type = 'sequences'
+                obj_type = _OBJECT_TYPE_KEYS.get(obj_type, obj_type)
                 
-                if obj_type not in operation_counts:
-                    operation_counts[obj_type] = {'CREATE': 0, 'DROP': 0, 'MODIFY': 0}
+                counts = operation_counts.get(obj_type)
+                if counts is None:
+                    counts = operation_counts[obj_type] = {'CREATE': 0, 'DROP': 0, 'MODIFY': 0}
                 
-                if operation in operation_counts[obj_type]:
-                    operation_counts[obj_type][operation] += 1
+                if operation in counts:
+                    counts[operation] += 1
         
         # Create header
         header = f"{'Object Type':<12} {'Source':<8} {'Dest':<8} {'Both':<8} {'Create':<8} {'Drop':<8} {'Modify':<8} {'Total':<8}"
@@ -808,6 +791,21 @@ class DDLWizardCore:
         return lines
 
 
+def _render_documentation(schema_data: Dict, output_dir: str):
+    """Analyze a schema and export its documentation in a worker process."""
+    visualizer = SchemaVisualizer()
+    visualizer.analyze_schema(schema_data)
+    visualizer.export_documentation(output_dir)
+    logger.info(f"Schema visualizations generated in {output_dir}")
+
+
+def _join_documentation(process: multiprocessing.Process):
+    """Wait for a background documentation render before the interpreter exits."""
+    process.join()
+    if process.exitcode != 0:
+        logger.error(f"Schema visualization failed with exit code {process.exitcode}")
+
+
 def run_complete_migration(source_config: DatabaseConfig, dest_config: DatabaseConfig, 
                          config: DDLWizardConfig, output_dir: str, 
                          skip_safety_checks: bool = False, 
@@ -830,62 +828,80 @@ def run_complete_migration(source_config: DatabaseConfig, dest_config: DatabaseC
     """
     core = DDLWizardCore(config)
     
-    # Connect to databases
-    if not core.connect_databases(source_config, dest_config):
-        raise RuntimeError("Failed to connect to databases")
-    
-    # Initialize git repository
-    if not core.initialize_git_repository(output_dir):
-        raise RuntimeError("Failed to initialize git repository")
-    
-    # Extract schema objects
-    source_objects, dest_objects = core.extract_schema_objects()
-    
-    # Compare schemas
-    comparison = core.compare_schemas(source_objects, dest_objects)
-    
-    # Perform safety analysis
-    migration_operations = []  # TODO: Extract from comparison
-    safety_warnings = []
-    if not skip_safety_checks:
-        safety_warnings = core.perform_safety_analysis(migration_operations)
-    
-    # Generate migration SQL
-    migration_sql = core.generate_migration_sql(comparison, source_config, dest_config)
-    
-    # Generate rollback SQL
-    rollback_sql = core.generate_rollback_sql(comparison, source_objects, dest_objects)
-    
-    # Generate migration report
-    migration_report_data = core.generate_migration_report(comparison, safety_warnings, source_config, dest_config)
-    
-    # Generate schema visualization if requested
-    if enable_visualization:
-        core.generate_schema_visualization(source_objects, dest_objects, comparison, output_dir)
-    
-    # Write files
-    migration_file, rollback_file, migration_report_file = core.write_migration_files(
-        migration_sql, rollback_sql, migration_report_data, output_dir, 
-        comparison, source_objects
-    )
-    
-    # Record in history
-    operation_count = len(migration_report_data['detailed_changes'])
-    migration_name = f"{source_config.schema}_to_{dest_config.schema}_{int(time.time())}"
-    migration_id = core.record_migration_history(
-        migration_name, source_config, dest_config, operation_count, 
-        migration_file, rollback_file, len(safety_warnings)
-    )
-    
-    return {
-        'migration_id': migration_id,
-        'migration_file': migration_file,
-        'rollback_file': rollback_file,
-        'migration_report_file': migration_report_file,
-        'output_dir': output_dir,
-        'operation_count': operation_count,
-        'safety_warnings': safety_warnings,
-        'comparison': comparison,
-        'migration_sql': migration_sql,
-        'rollback_sql': rollback_sql
-    }
+    try:
+        # Connect to databases
+        if not core.connect_databases(source_config, dest_config):
+            raise RuntimeError("Failed to connect to databases")
+        
+        # Initialize git repository
+        if not core.initialize_git_repository(output_dir):
+            raise RuntimeError("Failed to initialize git repository")
+        
+        # Extract schema objects
+        source_objects, dest_objects = core.extract_schema_objects()
+        
+        # Compare schemas
+        comparison = core.compare_schemas(source_objects, dest_objects)
+        
+        # When both schemas hash the same there is nothing to diff, so the SQL generators
+        # get a comparison without common objects and skip all per-object DDL analysis;
+        # the report and summary still describe the full comparison
+        source_fingerprint, dest_fingerprint = core.schema_fingerprints(source_objects, dest_objects)
+        changes = comparison
+        if source_fingerprint == dest_fingerprint:
+            logger.info("Source and destination schemas are identical, skipping DDL comparison")
+            changes = {
+                object_type: {**object_comparison, 'in_both': []}
+                for object_type, object_comparison in comparison.items()
+            }
+        
+        # Perform safety analysis
+        migration_operations = []  # TODO: Extract from comparison
+        safety_warnings = []
+        if not skip_safety_checks:
+            safety_warnings = core.perform_safety_analysis(migration_operations)
+        
+        # Documentation rendering is CPU-bound and nothing downstream reads it, so it runs
+        # in its own process while the scripts, report and history record are produced and
+        # may still be finishing after the results are returned
+        if enable_visualization:
+            core.generate_schema_visualization(source_objects, dest_objects, comparison, output_dir, background=True)
+        
+        # Migration SQL, rollback SQL and the report are CPU-bound pure Python sharing the
+        # DDL caches, so they run one after another rather than contending for the GIL;
+        # both scripts are streamed to disk as they are generated
+        output_path = Path(output_dir)
+        migration_file = str(output_path / config.output.migration_file)
+        rollback_file = str(output_path / config.output.rollback_file)
+        core.write_migration_sql(Path(migration_file), changes, source_config, dest_config)
+        core.write_rollback_sql(Path(rollback_file), changes, source_objects, dest_objects)
+        migration_report_data = core.generate_migration_report(
+            comparison, safety_warnings, source_config, dest_config
+        )
+        migration_report_file = core.write_migration_report(migration_report_data, migration_file, output_dir, comparison, source_objects)
+        
+        # Record in history
+        operation_count = len(migration_report_data['detailed_changes'])
+        # Named after the schema contents rather than the clock, so re-running the same
+        # comparison yields the same migration name
+        schema_digest = hashlib.blake2b(source_fingerprint + dest_fingerprint, digest_size=8).hexdigest()
+        migration_name = f"{source_config.schema}_to_{dest_config.schema}_{schema_digest}"
+        migration_id = core.record_migration_history(
+            migration_name, source_config, dest_config, operation_count, 
+            migration_file, rollback_file, len(safety_warnings),
+            migration_report_data['detailed_changes']
+        )
+        
+        return {
+            'migration_id': migration_id,
+            'migration_file': migration_file,
+            'rollback_file': rollback_file,
+            'migration_report_file': migration_report_file,
+            'output_dir': output_dir,
+            'operation_count': operation_count,
+            'safety_warnings': safety_warnings,
+            'comparison': comparison
+        }
+    finally:
+        # The pooled connections would otherwise stay open until the process exits
+        core.close_databases()
@@ -334,7 +334,9 @@ def create_database_config_form(prefix: str, label: str) -> DatabaseConfig:
                     config = DatabaseConfig(host, port, username, password or "", schema)
                     from database import DatabaseManager
                     db = DatabaseManager(config)
-                    if db.test_connection():
+                    connected = db.test_connection()
+                    db.close()
+                    if connected:
                         st.success(f"✅ {label} connection successful!")
                     else:
                         st.error(f"❌ {label} connection failed!")
@@ -581,26 +583,28 @@ def display_migration_results(results: Dict[str, Any]):
     # Display SQL content in scrollable containers
     if st.checkbox("Show Migration SQL", value=False):
         st.subheader("🔄 Migration SQL")
+        migration_sql = Path(results['migration_file']).read_text()
         st.markdown("""
         <div class="sql-content-container" style="max-height: 400px;">
         """, unsafe_allow_html=True)
-        st.code(results['migration_sql'], language='sql')
+        st.code(migration_sql, language='sql')
         st.markdown("</div>", unsafe_allow_html=True)
         
         # Show line count
-        line_count = len(results['migration_sql'].split('\n'))
+        line_count = len(migration_sql.splitlines())
         st.caption(f"📏 {line_count} lines of SQL")
     
     if st.checkbox("Show Rollback SQL", value=False):
         st.subheader("↩️ Rollback SQL")
+        rollback_sql = Path(results['rollback_file']).read_text()
         st.markdown("""
         <div class="sql-content-container" style="max-height: 400px;">
         """, unsafe_allow_html=True)
-        st.code(results['rollback_sql'], language='sql')
+        st.code(rollback_sql, language='sql')
         st.markdown("</div>", unsafe_allow_html=True)
         
         # Show line count
-        line_count = len(results['rollback_sql'].split('\n'))
+        line_count = len(rollback_sql.splitlines())
         st.caption(f"📏 {line_count} lines of SQL")
     
     # Display safety warnings if any
@@ -1327,6 +1331,7 @@ Schema: {target_config.schema}
         progress_bar = st.progress(0)
         status_text = st.empty()
         
+        db = None
         try:
             status_text.text("🔗 Connecting to target database...")
             progress_bar.progress(20)
@@ -1361,6 +1366,8 @@ Schema: {target_config.schema}
         finally:
             progress_bar.empty()
             status_text.empty()
+            if db is not None:
+                db.close()
             
             # Clean up temporary file if created
             if file_source == "Upload File" and sql_file_path:
@@ -1384,7 +1391,9 @@ def test_database_connection(config: DatabaseConfig, label: str) -> bool:
     try:
         from database import DatabaseManager
         db = DatabaseManager(config)
-        if db.test_connection():
+        connected = db.test_connection()
+        db.close()
+        if connected:
             st.success(f"✅ {label} connection successful!")
             return True
         else:
@@ -9,9 +9,18 @@ and generating migration scripts for schema synchronization.
 __version__ = "1.3.0"
 __author__ = "Claudio Nanni"
 
-# Import main classes for easy access
-from .core import DDLWizardCore
-from .cli import main as cli_main
-from .gui import main as gui_main
-
 __all__ = ['DDLWizardCore', 'cli_main', 'gui_main']
+
+
+def __getattr__(name):
+    """Import the main classes on first access so the CLI does not load Streamlit."""
+    if name == 'DDLWizardCore':
+        from .core import DDLWizardCore
+        return DDLWizardCore
+    if name == 'cli_main':
+        from .cli import main as cli_main
+        return cli_main
+    if name == 'gui_main':
+        from .gui import main as gui_main
+        return gui_main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
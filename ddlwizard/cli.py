@@ -15,12 +15,12 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator
 
-from .utils.database import DatabaseManager, DatabaseConfig
 from .utils.config import DDLWizardConfig
-from .utils.interactive import InteractiveModeManager
-from .core import DDLWizardCore, run_complete_migration
+
+# The database, core and reporting modules are imported inside the mode functions
+# that use them, so --help and history mode start without loading them
 
 # Set up logging
 logging.basicConfig(
@@ -34,13 +34,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_objects: Dict, alter_generator, get_source_ddl, get_dest_ddl) -> List[str]:
-    """Generate detailed rollback SQL for all schema changes."""
-    rollback_lines = []
+def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_objects: Dict, alter_generator, get_source_ddl, get_dest_ddl) -> Iterator[str]:
+    """Yield the detailed rollback SQL lines for all schema changes."""
+    from .utils.comparator import same_ddl_ignoring_whitespace
     
     # Add header comment with proper formatting similar to migration script
     from datetime import datetime
-    rollback_lines.extend([
+    yield from [
         "-- DDL Wizard Rollback Script",
         f"-- Source Schema: {getattr(alter_generator, 'dest_schema', 'unknown')}",
         f"-- Destination Schema: {getattr(alter_generator, 'dest_schema', 'unknown')}",
@@ -53,7 +53,7 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
         "",
         "-- Detailed rollback for all schema changes",
         ""
-    ])
+    ]
     
     # Process tables that exist in both and may have structural differences
     if 'tables' in comparison:
@@ -64,21 +64,21 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
             try:
                 dest_ddl = get_dest_ddl('tables', table_name)
                 if dest_ddl:
-                    rollback_lines.append(f"-- Rollback table drop: {table_name}")
-                    rollback_lines.append(dest_ddl + ";")
-                    rollback_lines.append("")
+                    yield f"-- Rollback table drop: {table_name}"
+                    yield dest_ddl + ";"
+                    yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to recreate table {table_name}: {str(e)}")
+                yield f"-- ERROR: Failed to recreate table {table_name}: {str(e)}"
                 continue
         
         # Handle tables that were created in migration (only in source - need to be dropped)
         for table_name in tables_comparison.get('only_in_source', []):
             try:
-                rollback_lines.append(f"-- Rollback table creation: {table_name}")
-                rollback_lines.append(f"DROP TABLE IF EXISTS `{table_name}`;")
-                rollback_lines.append("")
+                yield f"-- Rollback table creation: {table_name}"
+                yield f"DROP TABLE IF EXISTS `{table_name}`;"
+                yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to drop table {table_name}: {str(e)}")
+                yield f"-- ERROR: Failed to drop table {table_name}: {str(e)}"
                 continue
         
         # Handle tables that exist in both and may have structural differences
@@ -92,7 +92,7 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
                     # Use the comparator to analyze table differences
                     # For rollback, we use the original migration differences (source to dest)
                     # and generate inverse operations to restore the original state
-                    from schema_comparator import SchemaComparator
+                    from .utils.comparator import SchemaComparator
                     temp_comparator = SchemaComparator()
                     differences = temp_comparator.analyze_table_differences(table_name, source_ddl, dest_ddl)
                     
@@ -101,10 +101,10 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
                         dest_ddl = get_dest_ddl('tables', table_name) if table_name in tables_comparison.get('in_both', []) else ''
                         rollback_statements = alter_generator.generate_rollback_statements(table_name, differences, dest_ddl)
                         for stmt in rollback_statements:
-                            rollback_lines.append(stmt + ";")
-                        rollback_lines.append("")
+                            yield stmt + ";"
+                        yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process table {table_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process table {table_name}: {str(e)}"
                 continue
     
     # Process procedures that exist in both and may have differences
@@ -118,30 +118,27 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
                 dest_ddl = get_dest_ddl('procedures', proc_name)
                 
                 # Only generate rollback if there are actual differences
-                source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                
-                if source_normalized != dest_normalized and dest_ddl:
-                    rollback_lines.append(f"-- Rollback procedure: {proc_name}")
-                    rollback_lines.append(f"DROP PROCEDURE IF EXISTS `{proc_name}`;")
-                    rollback_lines.append("DELIMITER $$")
-                    rollback_lines.append(dest_ddl + "$$")
-                    rollback_lines.append("DELIMITER ;")
-                    rollback_lines.append("")
+                if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl) and dest_ddl:
+                    yield f"-- Rollback procedure: {proc_name}"
+                    yield f"DROP PROCEDURE IF EXISTS `{proc_name}`;"
+                    yield "DELIMITER $$"
+                    yield dest_ddl + "$$"
+                    yield "DELIMITER ;"
+                    yield ""
                     
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process procedure {proc_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process procedure {proc_name}: {str(e)}"
                 continue
         
         # Handle procedures that are only in source (created in migration)
         for proc_name in procedures_comparison.get('only_in_source', []):
             try:
                 # Drop the created procedure
-                rollback_lines.append(f"-- Rollback creation of procedure: {proc_name}")
-                rollback_lines.append(f"DROP PROCEDURE IF EXISTS `{proc_name}`;")
-                rollback_lines.append("")
+                yield f"-- Rollback creation of procedure: {proc_name}"
+                yield f"DROP PROCEDURE IF EXISTS `{proc_name}`;"
+                yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process procedure {proc_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process procedure {proc_name}: {str(e)}"
                 continue
         
         # Handle procedures that are only in destination (dropped in migration)
@@ -149,13 +146,13 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
             try:
                 dest_ddl = get_dest_ddl('procedures', proc_name)
                 if dest_ddl:
-                    rollback_lines.append(f"-- Rollback deletion of procedure: {proc_name}")
-                    rollback_lines.append("DELIMITER $$")
-                    rollback_lines.append(dest_ddl + "$$")
-                    rollback_lines.append("DELIMITER ;")
-                    rollback_lines.append("")
+                    yield f"-- Rollback deletion of procedure: {proc_name}"
+                    yield "DELIMITER $$"
+                    yield dest_ddl + "$$"
+                    yield "DELIMITER ;"
+                    yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to restore procedure {proc_name}: {str(e)}")
+                yield f"-- ERROR: Failed to restore procedure {proc_name}: {str(e)}"
                 continue
     
     # Process functions that exist in both and may have differences  
@@ -169,30 +166,27 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
                 dest_ddl = get_dest_ddl('functions', func_name)
                 
                 # Only generate rollback if there are actual differences
-                source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                
-                if source_normalized != dest_normalized and dest_ddl:
-                    rollback_lines.append(f"-- Rollback function: {func_name}")
-                    rollback_lines.append(f"DROP FUNCTION IF EXISTS `{func_name}`;")
-                    rollback_lines.append("DELIMITER $$")
-                    rollback_lines.append(dest_ddl + "$$")
-                    rollback_lines.append("DELIMITER ;")
-                    rollback_lines.append("")
+                if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl) and dest_ddl:
+                    yield f"-- Rollback function: {func_name}"
+                    yield f"DROP FUNCTION IF EXISTS `{func_name}`;"
+                    yield "DELIMITER $$"
+                    yield dest_ddl + "$$"
+                    yield "DELIMITER ;"
+                    yield ""
                     
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process function {func_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process function {func_name}: {str(e)}"
                 continue
         
         # Handle functions that are only in source (created in migration)
         for func_name in functions_comparison.get('only_in_source', []):
             try:
                 # Drop the created function
-                rollback_lines.append(f"-- Rollback creation of function: {func_name}")
-                rollback_lines.append(f"DROP FUNCTION IF EXISTS `{func_name}`;")
-                rollback_lines.append("")
+                yield f"-- Rollback creation of function: {func_name}"
+                yield f"DROP FUNCTION IF EXISTS `{func_name}`;"
+                yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process function {func_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process function {func_name}: {str(e)}"
                 continue
         
         # Handle functions that are only in destination (dropped in migration)
@@ -200,13 +194,13 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
             try:
                 dest_ddl = get_dest_ddl('functions', func_name)
                 if dest_ddl:
-                    rollback_lines.append(f"-- Rollback deletion of function: {func_name}")
-                    rollback_lines.append("DELIMITER $$")
-                    rollback_lines.append(dest_ddl + "$$")
-                    rollback_lines.append("DELIMITER ;")
-                    rollback_lines.append("")
+                    yield f"-- Rollback deletion of function: {func_name}"
+                    yield "DELIMITER $$"
+                    yield dest_ddl + "$$"
+                    yield "DELIMITER ;"
+                    yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to restore function {func_name}: {str(e)}")
+                yield f"-- ERROR: Failed to restore function {func_name}: {str(e)}"
                 continue
     
     # Process triggers that exist in both and may have differences  
@@ -220,30 +214,27 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
                 dest_ddl = get_dest_ddl('triggers', trigger_name)
                 
                 # Only generate rollback if there are actual differences
-                source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                
-                if source_normalized != dest_normalized and dest_ddl:
-                    rollback_lines.append(f"-- Rollback trigger: {trigger_name}")
-                    rollback_lines.append(f"DROP TRIGGER IF EXISTS `{trigger_name}`;")
-                    rollback_lines.append("DELIMITER $$")
-                    rollback_lines.append(dest_ddl + "$$")
-                    rollback_lines.append("DELIMITER ;")
-                    rollback_lines.append("")
+                if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl) and dest_ddl:
+                    yield f"-- Rollback trigger: {trigger_name}"
+                    yield f"DROP TRIGGER IF EXISTS `{trigger_name}`;"
+                    yield "DELIMITER $$"
+                    yield dest_ddl + "$$"
+                    yield "DELIMITER ;"
+                    yield ""
                     
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process trigger {trigger_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process trigger {trigger_name}: {str(e)}"
                 continue
         
         # Handle triggers that are only in source (created in migration)
         for trigger_name in triggers_comparison.get('only_in_source', []):
             try:
                 # Drop the created trigger
-                rollback_lines.append(f"-- Rollback creation of trigger: {trigger_name}")
-                rollback_lines.append(f"DROP TRIGGER IF EXISTS `{trigger_name}`;")
-                rollback_lines.append("")
+                yield f"-- Rollback creation of trigger: {trigger_name}"
+                yield f"DROP TRIGGER IF EXISTS `{trigger_name}`;"
+                yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process trigger {trigger_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process trigger {trigger_name}: {str(e)}"
                 continue
         
         # Handle triggers that are only in destination (dropped in migration)
@@ -251,13 +242,13 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
             try:
                 dest_ddl = get_dest_ddl('triggers', trigger_name)
                 if dest_ddl:
-                    rollback_lines.append(f"-- Rollback deletion of trigger: {trigger_name}")
-                    rollback_lines.append("DELIMITER $$")
-                    rollback_lines.append(dest_ddl + "$$")
-                    rollback_lines.append("DELIMITER ;")
-                    rollback_lines.append("")
+                    yield f"-- Rollback deletion of trigger: {trigger_name}"
+                    yield "DELIMITER $$"
+                    yield dest_ddl + "$$"
+                    yield "DELIMITER ;"
+                    yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to restore trigger {trigger_name}: {str(e)}")
+                yield f"-- ERROR: Failed to restore trigger {trigger_name}: {str(e)}"
                 continue
 
     # Process events that exist in both and may have differences  
@@ -271,32 +262,29 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
                 dest_ddl = get_dest_ddl('events', event_name)
                 
                 # Only generate rollback if there are actual differences
-                source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                
-                if source_normalized != dest_normalized and dest_ddl:
-                    rollback_lines.append(f"-- Rollback event: {event_name}")
-                    rollback_lines.append(f"DROP EVENT IF EXISTS `{event_name}`;")
+                if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl) and dest_ddl:
+                    yield f"-- Rollback event: {event_name}"
+                    yield f"DROP EVENT IF EXISTS `{event_name}`;"
                     # Apply delimiter adaptation for Events (adds DELIMITER $$ / DELIMITER ;)
-                    from schema_comparator import SchemaComparator
+                    from .utils.comparator import SchemaComparator
                     temp_comparator = SchemaComparator()
                     adapted_ddl = temp_comparator._adapt_ddl_for_destination(dest_ddl, alter_generator.dest_schema)
-                    rollback_lines.append(adapted_ddl)
-                    rollback_lines.append("")
+                    yield adapted_ddl
+                    yield ""
                     
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process event {event_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process event {event_name}: {str(e)}"
                 continue
         
         # Handle events that are only in source (created in migration)
         for event_name in events_comparison.get('only_in_source', []):
             try:
                 # Drop the created event
-                rollback_lines.append(f"-- Rollback creation of event: {event_name}")
-                rollback_lines.append(f"DROP EVENT IF EXISTS `{event_name}`;")
-                rollback_lines.append("")
+                yield f"-- Rollback creation of event: {event_name}"
+                yield f"DROP EVENT IF EXISTS `{event_name}`;"
+                yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process event {event_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process event {event_name}: {str(e)}"
                 continue
         
         # Handle events that are only in destination (dropped in migration)
@@ -304,15 +292,15 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
             try:
                 dest_ddl = get_dest_ddl('events', event_name)
                 if dest_ddl:
-                    rollback_lines.append(f"-- Rollback deletion of event: {event_name}")
+                    yield f"-- Rollback deletion of event: {event_name}"
                     # Apply delimiter adaptation for Events (adds DELIMITER $$ / DELIMITER ;)
-                    from schema_comparator import SchemaComparator
+                    from .utils.comparator import SchemaComparator
                     temp_comparator = SchemaComparator()
                     adapted_ddl = temp_comparator._adapt_ddl_for_destination(dest_ddl, alter_generator.dest_schema)
-                    rollback_lines.append(adapted_ddl)
-                    rollback_lines.append("")
+                    yield adapted_ddl
+                    yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to restore event {event_name}: {str(e)}")
+                yield f"-- ERROR: Failed to restore event {event_name}: {str(e)}"
                 continue
 
     # Process views that exist in both and may have differences  
@@ -326,28 +314,25 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
                 dest_ddl = get_dest_ddl('views', view_name)
                 
                 # Only generate rollback if there are actual differences
-                source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                
-                if source_normalized != dest_normalized and dest_ddl:
-                    rollback_lines.append(f"-- Rollback view: {view_name}")
-                    rollback_lines.append(f"DROP VIEW IF EXISTS `{view_name}`;")
-                    rollback_lines.append(dest_ddl + ";")
-                    rollback_lines.append("")
+                if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl) and dest_ddl:
+                    yield f"-- Rollback view: {view_name}"
+                    yield f"DROP VIEW IF EXISTS `{view_name}`;"
+                    yield dest_ddl + ";"
+                    yield ""
                     
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process view {view_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process view {view_name}: {str(e)}"
                 continue
         
         # Handle views that are only in source (created in migration)
         for view_name in views_comparison.get('only_in_source', []):
             try:
                 # Drop the created view
-                rollback_lines.append(f"-- Rollback creation of view: {view_name}")
-                rollback_lines.append(f"DROP VIEW IF EXISTS `{view_name}`;")
-                rollback_lines.append("")
+                yield f"-- Rollback creation of view: {view_name}"
+                yield f"DROP VIEW IF EXISTS `{view_name}`;"
+                yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process view {view_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process view {view_name}: {str(e)}"
                 continue
         
         # Handle views that are only in destination (dropped in migration)
@@ -355,11 +340,11 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
             try:
                 dest_ddl = get_dest_ddl('views', view_name)
                 if dest_ddl:
-                    rollback_lines.append(f"-- Rollback deletion of view: {view_name}")
-                    rollback_lines.append(dest_ddl + ";")
-                    rollback_lines.append("")
+                    yield f"-- Rollback deletion of view: {view_name}"
+                    yield dest_ddl + ";"
+                    yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to restore view {view_name}: {str(e)}")
+                yield f"-- ERROR: Failed to restore view {view_name}: {str(e)}"
                 continue
 
     # Process sequences that exist in both and may have differences  
@@ -373,28 +358,25 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
                 dest_ddl = get_dest_ddl('sequences', sequence_name)
                 
                 # Only generate rollback if there are actual differences
-                source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                
-                if source_normalized != dest_normalized and dest_ddl:
-                    rollback_lines.append(f"-- Rollback sequence: {sequence_name}")
-                    rollback_lines.append(f"DROP SEQUENCE IF EXISTS `{sequence_name}`;")
-                    rollback_lines.append(dest_ddl + ";")
-                    rollback_lines.append("")
+                if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl) and dest_ddl:
+                    yield f"-- Rollback sequence: {sequence_name}"
+                    yield f"DROP SEQUENCE IF EXISTS `{sequence_name}`;"
+                    yield dest_ddl + ";"
+                    yield ""
                     
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process sequence {sequence_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process sequence {sequence_name}: {str(e)}"
                 continue
         
         # Handle sequences that are only in source (created in migration)
         for sequence_name in sequences_comparison.get('only_in_source', []):
             try:
                 # Drop the created sequence
-                rollback_lines.append(f"-- Rollback creation of sequence: {sequence_name}")
-                rollback_lines.append(f"DROP SEQUENCE IF EXISTS `{sequence_name}`;")
-                rollback_lines.append("")
+                yield f"-- Rollback creation of sequence: {sequence_name}"
+                yield f"DROP SEQUENCE IF EXISTS `{sequence_name}`;"
+                yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to process sequence {sequence_name}: {str(e)}")
+                yield f"-- ERROR: Failed to process sequence {sequence_name}: {str(e)}"
                 continue
         
         # Handle sequences that are only in destination (dropped in migration)
@@ -402,22 +384,21 @@ def generate_detailed_rollback_sql(comparison: Dict, source_objects: Dict, dest_
             try:
                 dest_ddl = get_dest_ddl('sequences', sequence_name)
                 if dest_ddl:
-                    rollback_lines.append(f"-- Rollback deletion of sequence: {sequence_name}")
-                    rollback_lines.append(dest_ddl + ";")
-                    rollback_lines.append("")
+                    yield f"-- Rollback deletion of sequence: {sequence_name}"
+                    yield dest_ddl + ";"
+                    yield ""
             except Exception as e:
-                rollback_lines.append(f"-- ERROR: Failed to restore sequence {sequence_name}: {str(e)}")
+                yield f"-- ERROR: Failed to restore sequence {sequence_name}: {str(e)}"
                 continue
     
     # Add closing statements
-    rollback_lines.extend([
+    yield from [
         "",
         "SET FOREIGN_KEY_CHECKS = 1;",
         "",
         "-- Rollback script completed."
-    ])
+    ]
     
-    return rollback_lines
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -624,6 +605,9 @@ def extract_mode(config: DDLWizardConfig, args: argparse.Namespace):
         sys.exit(1)
     
     try:
+        from .utils.database import DatabaseConfig
+        from .core import DDLWizardCore
+        
         # Create core instance
         core = DDLWizardCore(config)
         
@@ -671,6 +655,9 @@ def visualize_mode(config: DDLWizardConfig, args: argparse.Namespace):
         sys.exit(1)
     
     try:
+        from .utils.database import DatabaseConfig
+        from .core import DDLWizardCore
+        
         # Create core instance
         core = DDLWizardCore(config)
         
@@ -717,32 +704,39 @@ def history_mode(config: DDLWizardConfig, args: argparse.Namespace):
             print("No migration history found.")
             return
         
-        print(f"\nMigration History (Last {len(migrations)} migrations):")
-        print("-" * 80)
-        
-        for migration in migrations:
-            print(f"ID: {migration['id']}")
-            print(f"Name: {migration['migration_name']}")
-            print(f"Source: {migration['source_schema']} → Destination: {migration['destination_schema']}")
-            print(f"Status: {migration['status']}")
-            print(f"Operations: {migration['operation_count']}")
-            print(f"Started: {migration['start_time']}")
-            if migration['end_time']:
-                print(f"Completed: {migration['end_time']}")
-            print("-" * 80)
+        separator = "-" * 80
+        format_record = (
+            "ID: {}\n"
+            "Name: {}\n"
+            "Source: {} → Destination: {}\n"
+            "Status: {}\n"
+            "Operations: {}\n"
+            "Executed: {} ({:.2f}s)\n" + separator
+        ).format
+        
+        # Build the whole listing and write it once rather than printing line by line
+        sys.stdout.write("\n".join([
+            f"\nMigration History (Last {len(migrations)} migrations):",
+            separator,
+            *(format_record(m.id, m.migration_name, m.source_schema, m.destination_schema,
+                            m.status, m.operations_count, m.executed_at, m.execution_time)
+              for m in migrations)
+        ]))
+        sys.stdout.write("\n")
         
         # Show summary statistics
         from collections import Counter
         
-        statuses = [m['status'] for m in migrations]
+        statuses = [m.status for m in migrations]
         status_counts = Counter(statuses)
         
-        print(f"\nSummary:")
-        for status, count in status_counts.items():
-            print(f"{status}: {count}")
-        
         success_rate = (status_counts.get('SUCCESS', 0) / len(migrations)) * 100 if migrations else 0
-        print(f"Success rate: {success_rate:.1f}%")
+        sys.stdout.write("\n".join([
+            "\nSummary:",
+            *(f"{status}: {count}" for status, count in status_counts.items()),
+            f"Success rate: {success_rate:.1f}%"
+        ]) + "\n")
+        sys.stdout.flush()
         
     except Exception as e:
         logger.error(f"History mode failed: {e}")
@@ -757,6 +751,9 @@ def compare_mode(config: DDLWizardConfig, args: argparse.Namespace):
         logger.error("Both source and destination database configurations required for compare mode")
         sys.exit(1)
     
+    from .utils.database import DatabaseConfig
+    from .core import run_complete_migration
+    
     # Create database configurations
     source_config = DatabaseConfig(
         host=config.source.host,
@@ -799,18 +796,22 @@ def compare_mode(config: DDLWizardConfig, args: argparse.Namespace):
             for warning in results['safety_warnings']:
                 logger.warning(f"  {warning.level.value}: {warning.message}")
                 
-        print(f"\n✅ Schema comparison and migration generation completed successfully!")
-        print(f"Migration ID: {results['migration_id']}")
-        print(f"Operations: {results['operation_count']}")
-        print(f"Safety warnings: {len(results['safety_warnings'])}")
-        print(f"Migration file: {results['migration_file']}")
-        print(f"Rollback file: {results['rollback_file']}")
-        print(f"Migration report: {results['migration_report_file']}")
-        
         if getattr(args, 'dry_run', False):
-            print("✅ Dry run completed successfully!")
+            completion = "✅ Dry run completed successfully!"
         else:
-            print("✅ Migration analysis completed successfully!")
+            completion = "✅ Migration analysis completed successfully!"
+        
+        sys.stdout.write("\n".join([
+            "\n✅ Schema comparison and migration generation completed successfully!",
+            f"Migration ID: {results['migration_id']}",
+            f"Operations: {results['operation_count']}",
+            f"Safety warnings: {len(results['safety_warnings'])}",
+            f"Migration file: {results['migration_file']}",
+            f"Rollback file: {results['rollback_file']}",
+            f"Migration report: {results['migration_report_file']}",
+            completion
+        ]) + "\n")
+        sys.stdout.flush()
             
     except Exception as e:
         logger.error(f"Migration failed: {e}")
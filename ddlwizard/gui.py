@@ -104,7 +104,9 @@ def create_database_config_form(prefix: str, label: str) -> DatabaseConfig:
                     config = DatabaseConfig(host, port, username, password or "", schema)
                     from database import DatabaseManager
                     db = DatabaseManager(config)
-                    if db.test_connection():
+                    connected = db.test_connection()
+                    db.close()
+                    if connected:
                         st.success(f"✅ {label} connection successful!")
                     else:
                         st.error(f"❌ {label} connection failed!")
@@ -231,11 +233,11 @@ def display_migration_results(results: Dict[str, Any]):
     # Display SQL content
     if st.checkbox("Show Migration SQL", value=False):
         st.subheader("🔄 Migration SQL")
-        st.code(results['migration_sql'], language='sql')
+        st.code(Path(results['migration_file']).read_text(), language='sql')
     
     if st.checkbox("Show Rollback SQL", value=False):
         st.subheader("↩️ Rollback SQL")
-        st.code(results['rollback_sql'], language='sql')
+        st.code(Path(results['rollback_file']).read_text(), language='sql')
     
     # Display safety warnings if any
     if results['safety_warnings']:
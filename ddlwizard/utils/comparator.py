@@ -3,10 +3,66 @@ Schema Comparator for DDL Wizard.
 Analyzes differences between source and destination schemas.
 """
 
+import functools
 import re
 from datetime import datetime
 from enum import Enum
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, TextIO, Tuple
+
+
+# Patterns used for every parsed table and adapted object, compiled once
+_COMMENT_RE = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
+_CREATE_TABLE_BODY_RE = re.compile(r'CREATE\s+TABLE[^(]*\((.*)\)', re.IGNORECASE | re.DOTALL)
+_SPLIT_DELIMITER_RE = re.compile(r'[(),]')
+# Classifies a CREATE TABLE clause with one match: foreign key, other
+# key/constraint clause, or column definition
+_TABLE_CLAUSE_RE = re.compile(
+    r'^\s*(?:(?P<foreign_key>(?:CONSTRAINT.*)?FOREIGN\s+KEY)'
+    r'|(?P<clause>PRIMARY\s+KEY|UNIQUE|INDEX|KEY|CONSTRAINT)'
+    r'|(?P<column>`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s+(.+)))',
+    re.IGNORECASE
+)
+_KEY_RE = re.compile(r'^\s*(UNIQUE\s+)?(KEY|INDEX)\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*\((.*)\)', re.IGNORECASE)
+_CONSTRAINT_FOREIGN_KEY_RE = re.compile(
+    r'^\s*CONSTRAINT\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s+FOREIGN\s+KEY\s*\((.*?)\)\s+REFERENCES\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*\((.*?)\)(.*)$',
+    re.IGNORECASE
+)
+_INLINE_FOREIGN_KEY_RE = re.compile(
+    r'^\s*FOREIGN\s+KEY\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*\((.*?)\)\s+REFERENCES\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*\((.*?)\)(.*)$',
+    re.IGNORECASE
+)
+_STORED_OBJECT_RE = re.compile(r'CREATE\s+(?:DEFINER[^)]*\)?\s+)?(FUNCTION|PROCEDURE|TRIGGER)')
+_TABLE_COMMENT_RE = re.compile(r"COMMENT=['\"]([^'\"]*)['\"]", re.IGNORECASE)
+_ENGINE_RE = re.compile(r"ENGINE=(\w+)", re.IGNORECASE)
+_DEFAULT_CHARSET_RE = re.compile(r"DEFAULT\s+CHARSET=(\w+)", re.IGNORECASE)
+_COLLATE_RE = re.compile(r"COLLATE[=\s]+(\w+)", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _ddl_tokens(ddl: str) -> Tuple[str, ...]:
+    """Whitespace-split tokens of a DDL string, cached because the migration script,
+    rollback script and report each compare the same stored-object DDL."""
+    return tuple(ddl.split())
+
+
+def same_ddl_ignoring_whitespace(source_ddl: Optional[str], dest_ddl: Optional[str]) -> bool:
+    """
+    Check whether two DDL strings differ only in whitespace.
+    
+    Identical strings are accepted without tokenizing; otherwise the
+    whitespace-split tokens are compared directly, which is equivalent to
+    comparing the space-joined forms without building them.
+    
+    Args:
+        source_ddl: Source DDL, or None
+        dest_ddl: Destination DDL, or None
+        
+    Returns:
+        True if the DDLs match after whitespace normalization
+    """
+    if source_ddl == dest_ddl:
+        return True
+    return _ddl_tokens(source_ddl or '') == _ddl_tokens(dest_ddl or '')
 
 
 class ChangeType(Enum):
@@ -44,18 +100,19 @@ class SchemaComparator:
         if not source_ddl or not dest_ddl:
             return []
         
-        differences = []
+        # Identical DDL (destination already in sync) has nothing to diff
+        if source_ddl == dest_ddl:
+            return []
         
-        # Parse columns from both DDLs
-        source_columns = self._parse_columns(source_ddl)
-        dest_columns = self._parse_columns(dest_ddl)
+        differences = []
         
-        # Find column differences
-        source_col_names = set(source_columns.keys())
-        dest_col_names = set(dest_columns.keys())
+        # Parse columns, indexes and foreign keys from both DDLs
+        source_columns, source_indexes, source_foreign_keys = self._parse_table(source_ddl)
+        dest_columns, dest_indexes, dest_foreign_keys = self._parse_table(dest_ddl)
         
+        # Find column differences (dict key/item views support set operations)
         # Columns only in source (need to be added to dest to match source)
-        for col_name in sorted(source_col_names - dest_col_names):
+        for col_name in sorted(source_columns.keys() - dest_columns.keys()):
             differences.append({
                 'type': ChangeType.ADD_COLUMN.value,
                 'column_name': col_name,
@@ -64,7 +121,7 @@ class SchemaComparator:
             })
         
         # Columns only in dest (need to be removed from dest to match source)
-        for col_name in sorted(dest_col_names - source_col_names):
+        for col_name in sorted(dest_columns.keys() - source_columns.keys()):
             differences.append({
                 'type': ChangeType.REMOVE_COLUMN.value,
                 'column_name': col_name,
@@ -72,29 +129,20 @@ class SchemaComparator:
                 'description': f"Remove column '{col_name}'"
             })
         
-        # Columns in both (check for modifications)
-        for col_name in sorted(source_col_names & dest_col_names):
-            source_def = source_columns[col_name].strip()
-            dest_def = dest_columns[col_name].strip()
-            
-            if source_def != dest_def:
-                differences.append({
-                    'type': ChangeType.MODIFY_COLUMN.value,
-                    'column_name': col_name,
-                    'original_definition': dest_def,
-                    'new_definition': source_def,
-                    'description': f"Modify column '{col_name}'"
-                })
-        
-        # Parse and compare indexes
-        source_indexes = self._parse_indexes(source_ddl)
-        dest_indexes = self._parse_indexes(dest_ddl)
-        
-        source_idx_names = set(source_indexes.keys())
-        dest_idx_names = set(dest_indexes.keys())
+        # Columns in both whose definition differs (check for modifications)
+        changed_col_names = {name for name, _ in source_columns.items() - dest_columns.items()}
+        for col_name in sorted(changed_col_names & dest_columns.keys()):
+            differences.append({
+                'type': ChangeType.MODIFY_COLUMN.value,
+                'column_name': col_name,
+                'original_definition': dest_columns[col_name],
+                'new_definition': source_columns[col_name],
+                'description': f"Modify column '{col_name}'"
+            })
         
+        # Compare indexes
         # Indexes only in source (need to be added)
-        for idx_name in sorted(source_idx_names - dest_idx_names):
+        for idx_name in sorted(source_indexes.keys() - dest_indexes.keys()):
             differences.append({
                 'type': ChangeType.ADD_INDEX.value,
                 'index_name': idx_name,
@@ -103,7 +151,7 @@ class SchemaComparator:
             })
         
         # Indexes only in dest (need to be removed)
-        for idx_name in sorted(dest_idx_names - source_idx_names):
+        for idx_name in sorted(dest_indexes.keys() - source_indexes.keys()):
             differences.append({
                 'type': ChangeType.REMOVE_INDEX.value,
                 'index_name': idx_name,
@@ -111,15 +159,21 @@ class SchemaComparator:
                 'description': f"Remove index '{idx_name}'"
             })
         
-        # Parse and compare foreign keys
-        source_foreign_keys = self._parse_foreign_keys(source_ddl)
-        dest_foreign_keys = self._parse_foreign_keys(dest_ddl)
-        
-        source_fk_names = set(source_foreign_keys.keys())
-        dest_fk_names = set(dest_foreign_keys.keys())
+        # Indexes in both whose definition differs (need to be recreated)
+        changed_idx_names = {name for name, _ in source_indexes.items() - dest_indexes.items()}
+        for idx_name in sorted(changed_idx_names & dest_indexes.keys()):
+            differences.append({
+                'type': ChangeType.MODIFY_INDEX.value,
+                'index_name': idx_name,
+                'index_definition': source_indexes[idx_name],
+                'original_definition': dest_indexes[idx_name],
+                'new_definition': source_indexes[idx_name],
+                'description': f"Modify index '{idx_name}'"
+            })
         
+        # Compare foreign keys
         # Foreign keys only in source (need to be added)
-        for fk_name in sorted(source_fk_names - dest_fk_names):
+        for fk_name in sorted(source_foreign_keys.keys() - dest_foreign_keys.keys()):
             differences.append({
                 'type': ChangeType.ADD_CONSTRAINT.value,
                 'constraint_name': fk_name,
@@ -128,7 +182,7 @@ class SchemaComparator:
             })
         
         # Foreign keys only in dest (need to be removed)
-        for fk_name in sorted(dest_fk_names - source_fk_names):
+        for fk_name in sorted(dest_foreign_keys.keys() - source_foreign_keys.keys()):
             differences.append({
                 'type': ChangeType.REMOVE_CONSTRAINT.value,
                 'constraint_name': fk_name,
@@ -136,187 +190,116 @@ class SchemaComparator:
                 'description': f"Remove foreign key constraint '{fk_name}'"
             })
         
-        # Foreign keys in both (check for modifications)
-        for fk_name in sorted(source_fk_names & dest_fk_names):
-            source_def = source_foreign_keys[fk_name].strip()
-            dest_def = dest_foreign_keys[fk_name].strip()
-            
-            if source_def != dest_def:
-                differences.append({
-                    'type': ChangeType.MODIFY_CONSTRAINT.value,
-                    'constraint_name': fk_name,
-                    'original_definition': dest_def,
-                    'new_definition': source_def,
-                    'description': f"Modify foreign key constraint '{fk_name}'"
-                })
+        # Foreign keys in both whose definition differs (check for modifications)
+        changed_fk_names = {name for name, _ in source_foreign_keys.items() - dest_foreign_keys.items()}
+        for fk_name in sorted(changed_fk_names & dest_foreign_keys.keys()):
+            differences.append({
+                'type': ChangeType.MODIFY_CONSTRAINT.value,
+                'constraint_name': fk_name,
+                'original_definition': dest_foreign_keys[fk_name],
+                'new_definition': source_foreign_keys[fk_name],
+                'description': f"Modify foreign key constraint '{fk_name}'"
+            })
         
         # Compare table-level properties (COMMENT, ENGINE, etc.)
         differences.extend(self._compare_table_properties(table_name, source_ddl, dest_ddl))
         
         return differences
     
-    def _parse_columns(self, ddl: str) -> Dict[str, str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_table(ddl: str) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
         """
-        Parse column definitions from CREATE TABLE DDL.
+        Parse the columns, indexes and foreign keys of a CREATE TABLE statement.
+        
+        Each clause is classified in a single pass. Cached by DDL, so a table
+        compared by several steps is parsed once; the returned dictionaries are
+        shared and must not be modified.
         
         Args:
             ddl: The CREATE TABLE DDL statement
             
         Returns:
-            Dictionary mapping column names to their definitions
+            Tuple of column, index and foreign key definitions keyed by name
         """
         columns = {}
+        indexes = {}
+        foreign_keys = {}
         
-        # Remove comments and normalize whitespace
-        ddl_clean = re.sub(r'--[^\n]*', '', ddl)
-        ddl_clean = re.sub(r'/\*.*?\*/', '', ddl_clean, flags=re.DOTALL)
-        
-        # Find the column definitions inside the CREATE TABLE statement
-        create_match = re.search(r'CREATE\s+TABLE[^(]*\((.*)\)', ddl_clean, re.IGNORECASE | re.DOTALL)
-        if not create_match:
-            return columns
-        
-        columns_section = create_match.group(1)
-        
-        # Split by commas, but be careful about commas inside parentheses
-        parts = self._split_sql_parts(columns_section)
+        # Bound once; looked up for every clause of every parsed table
+        match_clause = _TABLE_CLAUSE_RE.match
         
-        for part in parts:
+        for part in SchemaComparator._table_definition_parts(ddl):
             part = part.strip()
             if not part:
                 continue
-                
-            # Skip constraints, keys, and indexes
-            if re.match(r'^\s*(PRIMARY\s+KEY|UNIQUE|INDEX|KEY|CONSTRAINT|FOREIGN\s+KEY)', part, re.IGNORECASE):
-                continue
             
-            # Extract column name (first word, possibly quoted)
-            col_match = re.match(r'^\s*`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s+(.+)', part)
-            if col_match:
-                col_name = col_match.group(1)
-                col_def = col_match.group(2).strip()
-                columns[col_name] = col_def
-        
-        return columns
-    
-    def _parse_indexes(self, ddl: str) -> Dict[str, str]:
-        """
-        Parse index definitions from CREATE TABLE DDL.
-        
-        Args:
-            ddl: The CREATE TABLE DDL statement
+            clause_match = match_clause(part)
+            if not clause_match:
+                continue
+            kind = clause_match.lastgroup
             
-        Returns:
-            Dictionary mapping index names to their definitions
-        """
-        indexes = {}
-        
-        # Remove comments and normalize whitespace
-        ddl_clean = re.sub(r'--[^\n]*', '', ddl)
-        ddl_clean = re.sub(r'/\*.*?\*/', '', ddl_clean, flags=re.DOTALL)
-        
-        # Find the column definitions inside the CREATE TABLE statement
-        create_match = re.search(r'CREATE\s+TABLE[^(]*\((.*)\)', ddl_clean, re.IGNORECASE | re.DOTALL)
-        if not create_match:
-            return indexes
-        
-        columns_section = create_match.group(1)
-        
-        # Split by commas, but be careful about commas inside parentheses
-        parts = self._split_sql_parts(columns_section)
-        
-        for part in parts:
-            part = part.strip()
-            if not part:
+            # Foreign keys: CONSTRAINT ... FOREIGN KEY, or inline FOREIGN KEY
+            if kind == 'foreign_key':
+                constraint_fk_match = _CONSTRAINT_FOREIGN_KEY_RE.match(part)
+                if constraint_fk_match:
+                    fk_name, local_columns, ref_table, ref_columns, on_clauses = constraint_fk_match.groups()
+                    fk_def = f"CONSTRAINT `{fk_name}` FOREIGN KEY ({local_columns}) REFERENCES `{ref_table}` ({ref_columns})"
+                else:
+                    inline_fk_match = _INLINE_FOREIGN_KEY_RE.match(part)
+                    if not inline_fk_match:
+                        continue
+                    fk_name, local_columns, ref_table, ref_columns, on_clauses = inline_fk_match.groups()
+                    fk_def = f"FOREIGN KEY `{fk_name}` ({local_columns}) REFERENCES `{ref_table}` ({ref_columns})"
+                
+                on_clauses = on_clauses.strip()
+                if on_clauses:
+                    fk_def += f" {on_clauses}"
+                foreign_keys[fk_name] = fk_def.strip()
                 continue
             
-            # Skip foreign key constraints - they are handled separately
-            if re.match(r'^\s*CONSTRAINT.*FOREIGN\s+KEY', part, re.IGNORECASE) or \
-               re.match(r'^\s*FOREIGN\s+KEY', part, re.IGNORECASE):
+            # Indexes: KEY or INDEX definitions, optionally UNIQUE
+            if kind == 'clause':
+                key_match = _KEY_RE.match(part)
+                if key_match:
+                    unique_prefix, index_type, index_name, index_columns = key_match.groups()
+                    index_def = f"{unique_prefix or ''}{index_type} `{index_name}` ({index_columns})"
+                    indexes[index_name] = index_def.strip()
                 continue
             
-            # Look for KEY or INDEX definitions
-            key_match = re.match(r'^\s*(UNIQUE\s+)?(KEY|INDEX)\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*\((.*)\)', part, re.IGNORECASE)
-            if key_match:
-                unique_prefix = key_match.group(1) or ''
-                index_type = key_match.group(2)
-                index_name = key_match.group(3)
-                index_columns = key_match.group(4)
-                
-                index_def = f"{unique_prefix}{index_type} `{index_name}` ({index_columns})"
-                indexes[index_name] = index_def.strip()
+            # Columns: anything that is not a constraint, key or index clause
+            columns[clause_match.group(4)] = clause_match.group(5).strip()
         
-        return indexes
+        return columns, indexes, foreign_keys
     
-    def _parse_foreign_keys(self, ddl: str) -> Dict[str, str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _table_definition_parts(ddl: str) -> Tuple[str, ...]:
         """
-        Parse foreign key constraint definitions from CREATE TABLE DDL.
+        Split the body of a CREATE TABLE statement into its clauses.
+        
+        Comments are removed first. The same DDL is parsed for columns, indexes
+        and foreign keys by every comparison step, so the result is cached.
         
         Args:
             ddl: The CREATE TABLE DDL statement
             
         Returns:
-            Dictionary mapping foreign key names to their definitions
+            Tuple of column, key and constraint clauses (empty if not a CREATE TABLE)
         """
-        foreign_keys = {}
-        
         # Remove comments and normalize whitespace
-        ddl_clean = re.sub(r'--[^\n]*', '', ddl)
-        ddl_clean = re.sub(r'/\*.*?\*/', '', ddl_clean, flags=re.DOTALL)
+        ddl_clean = _COMMENT_RE.sub('', ddl)
         
         # Find the column definitions inside the CREATE TABLE statement
-        create_match = re.search(r'CREATE\s+TABLE[^(]*\((.*)\)', ddl_clean, re.IGNORECASE | re.DOTALL)
+        create_match = _CREATE_TABLE_BODY_RE.search(ddl_clean)
         if not create_match:
-            return foreign_keys
-        
-        columns_section = create_match.group(1)
+            return ()
         
         # Split by commas, but be careful about commas inside parentheses
-        parts = self._split_sql_parts(columns_section)
-        
-        for part in parts:
-            part = part.strip()
-            if not part:
-                continue
-            
-            # Look for CONSTRAINT ... FOREIGN KEY definitions
-            constraint_fk_match = re.match(
-                r'^\s*CONSTRAINT\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s+FOREIGN\s+KEY\s*\((.*?)\)\s+REFERENCES\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*\((.*?)\)(.*)$',
-                part, re.IGNORECASE
-            )
-            if constraint_fk_match:
-                fk_name = constraint_fk_match.group(1)
-                local_columns = constraint_fk_match.group(2)
-                ref_table = constraint_fk_match.group(3)
-                ref_columns = constraint_fk_match.group(4)
-                on_clauses = constraint_fk_match.group(5).strip()
-                
-                fk_def = f"CONSTRAINT `{fk_name}` FOREIGN KEY ({local_columns}) REFERENCES `{ref_table}` ({ref_columns})"
-                if on_clauses:
-                    fk_def += f" {on_clauses}"
-                foreign_keys[fk_name] = fk_def.strip()
-                continue
-            
-            # Look for inline FOREIGN KEY definitions (without CONSTRAINT)
-            inline_fk_match = re.match(
-                r'^\s*FOREIGN\s+KEY\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*\((.*?)\)\s+REFERENCES\s+`?([a-zA-Z_][a-zA-Z0-9_]*)`?\s*\((.*?)\)(.*)$',
-                part, re.IGNORECASE
-            )
-            if inline_fk_match:
-                fk_name = inline_fk_match.group(1)
-                local_columns = inline_fk_match.group(2)
-                ref_table = inline_fk_match.group(3)
-                ref_columns = inline_fk_match.group(4)
-                on_clauses = inline_fk_match.group(5).strip()
-                
-                fk_def = f"FOREIGN KEY `{fk_name}` ({local_columns}) REFERENCES `{ref_table}` ({ref_columns})"
-                if on_clauses:
-                    fk_def += f" {on_clauses}"
-                foreign_keys[fk_name] = fk_def.strip()
-        
-        return foreign_keys
+        return tuple(SchemaComparator._split_sql_parts(create_match.group(1)))
     
-    def _split_sql_parts(self, sql: str) -> List[str]:
+    @staticmethod
+    def _split_sql_parts(sql: str) -> List[str]:
         """
         Split SQL by commas, respecting parentheses nesting.
         
@@ -327,23 +310,24 @@ class SchemaComparator:
             List of SQL parts
         """
         parts = []
-        current_part = ""
+        start = 0
         paren_depth = 0
         
-        for char in sql:
+        # Only parentheses and commas affect the split, so jump between them
+        # and slice the parts out instead of building them character by character
+        for delimiter in _SPLIT_DELIMITER_RE.finditer(sql):
+            char = delimiter.group()
             if char == '(':
                 paren_depth += 1
             elif char == ')':
                 paren_depth -= 1
-            elif char == ',' and paren_depth == 0:
-                parts.append(current_part.strip())
-                current_part = ""
-                continue
-            
-            current_part += char
+            elif paren_depth == 0:
+                parts.append(sql[start:delimiter.start()].strip())
+                start = delimiter.end()
         
-        if current_part.strip():
-            parts.append(current_part.strip())
+        last_part = sql[start:].strip()
+        if last_part:
+            parts.append(last_part)
         
         return parts
     
@@ -365,10 +349,11 @@ class SchemaComparator:
             source_names = {obj['name'] for obj in source_objects.get(obj_type, [])}
             dest_names = {obj['name'] for obj in dest_objects.get(obj_type, [])}
             
+            # Sorted once here so every consumer iterates names in a stable order
             comparison[obj_type] = {
-                'only_in_source': list(source_names - dest_names),
-                'only_in_dest': list(dest_names - source_names),
-                'in_both': list(source_names & dest_names)
+                'only_in_source': sorted(source_names - dest_names),
+                'only_in_dest': sorted(dest_names - source_names),
+                'in_both': sorted(source_names & dest_names)
             }
         
         return comparison
@@ -383,8 +368,7 @@ class SchemaComparator:
         # Check if this is a stored procedure, function, or trigger
         ddl_upper = adapted_ddl.upper()
         # Use regex to handle DEFINER clauses between CREATE and object type
-        import re
-        is_stored_object = bool(re.search(r'CREATE\s+(?:DEFINER[^)]*\)?\s+)?(FUNCTION|PROCEDURE|TRIGGER)', ddl_upper))
+        is_stored_object = bool(_STORED_OBJECT_RE.search(ddl_upper))
         
         if is_stored_object:
             # For stored procedures, functions, and triggers, we need to:
@@ -434,9 +418,36 @@ class SchemaComparator:
         Returns:
             Migration SQL script
         """
+        return '\n'.join(self._iter_migration_sql(
+            comparison, get_source_ddl_func, get_dest_ddl_func, source_schema, dest_schema
+        ))
+    
+    def write_migration_sql(self, fp: TextIO, comparison: Dict, get_source_ddl_func: Any,
+                            get_dest_ddl_func: Any, source_schema: str, dest_schema: str) -> None:
+        """
+        Stream the migration SQL to a writable text file object.
+        
+        Lines are written as they are produced instead of being collected
+        into one script string first.
+        
+        Args:
+            fp: Writable text file object
+            comparison: Schema comparison results
+            get_source_ddl_func: Function to get source DDL
+            get_dest_ddl_func: Function to get destination DDL
+            source_schema: Source schema name
+            dest_schema: Destination schema name
+        """
+        fp.writelines(f"{line}\n" for line in self._iter_migration_sql(
+            comparison, get_source_ddl_func, get_dest_ddl_func, source_schema, dest_schema
+        ))
+    
+    def _iter_migration_sql(self, comparison: Dict, get_source_ddl_func: Any, get_dest_ddl_func: Any,
+                            source_schema: str, dest_schema: str) -> Iterator[str]:
+        """Yield the lines of the migration SQL script in order."""
         from alter_generator import AlterStatementGenerator
         
-        sql_lines = [
+        yield from [
             "-- DDL Wizard Migration Script",
             f"-- Source Schema: {source_schema}",
             f"-- Destination Schema: {dest_schema}",
@@ -451,109 +462,103 @@ class SchemaComparator:
         
         alter_generator = AlterStatementGenerator(dest_schema)
         
-        # Helper functions to get DDL using the provided functions
-        def get_source_ddl(obj_type: str, obj_name: str) -> Optional[str]:
-            return get_source_ddl_func(obj_type, obj_name)
-        
-        def get_dest_ddl(obj_type: str, obj_name: str) -> Optional[str]:
-            return get_dest_ddl_func(obj_type, obj_name)
+        # Each object's DDL is fetched once below, so the callbacks are used
+        # directly; callers pass getters backed by their own per-run cache
+        get_source_ddl = get_source_ddl_func
+        get_dest_ddl = get_dest_ddl_func
         
         # Process table changes
-        sql_lines.extend([
+        yield from [
             "-- TABLES CHANGES",
             "--" + "-" * 48
-        ])
+        ]
         
         if 'tables' in comparison:
             tables_comparison = comparison['tables']
             
             # Tables only in source (to be created)
-            for table_name in sorted(tables_comparison.get('only_in_source', [])):
+            for table_name in tables_comparison.get('only_in_source', []):
                 try:
                     source_ddl = get_source_ddl('tables', table_name)
                     if source_ddl:
-                        sql_lines.append(f"-- Create table: {table_name}")
-                        sql_lines.append(source_ddl + ";")
-                        sql_lines.append("")
+                        yield f"-- Create table: {table_name}"
+                        yield source_ddl + ";"
+                        yield ""
                 except Exception:
-                    sql_lines.append(f"-- ERROR: Failed to process table {table_name}")
+                    yield f"-- ERROR: Failed to process table {table_name}"
             
             # Tables only in dest (to be dropped)
-            for table_name in sorted(tables_comparison.get('only_in_dest', [])):
-                sql_lines.append(f"-- Drop table: {table_name}")
-                sql_lines.append(f"DROP TABLE IF EXISTS `{dest_schema}`.`{table_name}`;")
-                sql_lines.append("")
+            for table_name in tables_comparison.get('only_in_dest', []):
+                yield f"-- Drop table: {table_name}"
+                yield f"DROP TABLE IF EXISTS `{dest_schema}`.`{table_name}`;"
+                yield ""
             
             # Tables with differences (to be modified)
-            for table_name in sorted(tables_comparison.get('in_both', [])):
+            for table_name in tables_comparison.get('in_both', []):
                 try:
                     source_ddl = get_source_ddl('tables', table_name)
                     dest_ddl = get_dest_ddl('tables', table_name)
                     if source_ddl and dest_ddl:
                         differences = self.analyze_table_differences(table_name, source_ddl, dest_ddl)
                         if differences:
-                            sql_lines.append(f"-- Modify table: {table_name}")
+                            yield f"-- Modify table: {table_name}"
                             
                             # Generate the differences report
                             report = alter_generator.generate_table_differences_report(table_name, differences)
                             for line in report.split('\n'):
-                                sql_lines.append(f"-- {line}")
+                                yield f"-- {line}"
                             
                             # Generate ALTER statements
                             alter_statements = alter_generator.generate_alter_statements(table_name, differences)
                             for stmt in alter_statements:
-                                sql_lines.append(stmt + ";")
-                            sql_lines.append("")
+                                yield stmt + ";"
+                            yield ""
                 except Exception as e:
-                    sql_lines.append(f"-- ERROR: Failed to process table {table_name}: {str(e)}")
+                    yield f"-- ERROR: Failed to process table {table_name}: {str(e)}"
         
         # Process procedure changes
-        sql_lines.extend([
+        yield from [
             "",
             "-- PROCEDURES CHANGES",
             "--" + "-" * 48
-        ])
+        ]
         
         if 'procedures' in comparison:
             procedures_comparison = comparison['procedures']
             
             # Procedures only in source (to be created)
-            for proc_name in sorted(procedures_comparison.get('only_in_source', [])):
+            for proc_name in procedures_comparison.get('only_in_source', []):
                 try:
                     source_ddl = get_source_ddl('procedures', proc_name)
                     if source_ddl:
-                        sql_lines.append(f"-- Create procedure: {proc_name}")
-                        sql_lines.append(f"DROP PROCEDURE IF EXISTS `{dest_schema}`.`{proc_name}`;")
+                        yield f"-- Create procedure: {proc_name}"
+                        yield f"DROP PROCEDURE IF EXISTS `{dest_schema}`.`{proc_name}`;"
                         adapted_ddl = self._adapt_ddl_for_destination(source_ddl, dest_schema)
-                        sql_lines.append(adapted_ddl)
-                        sql_lines.append("")
+                        yield adapted_ddl
+                        yield ""
                 except Exception:
-                    sql_lines.append(f"-- ERROR: Failed to process procedure {proc_name}")
+                    yield f"-- ERROR: Failed to process procedure {proc_name}"
             
             # Procedures only in dest (to be dropped)
-            for proc_name in sorted(procedures_comparison.get('only_in_dest', [])):
-                sql_lines.append(f"-- Drop procedure: {proc_name}")
-                sql_lines.append(f"DROP PROCEDURE IF EXISTS `{dest_schema}`.`{proc_name}`;")
-                sql_lines.append("")
+            for proc_name in procedures_comparison.get('only_in_dest', []):
+                yield f"-- Drop procedure: {proc_name}"
+                yield f"DROP PROCEDURE IF EXISTS `{dest_schema}`.`{proc_name}`;"
+                yield ""
             
             # Procedures in both (to be updated)
-            for proc_name in sorted(procedures_comparison.get('in_both', [])):
+            for proc_name in procedures_comparison.get('in_both', []):
                 try:
                     source_ddl = get_source_ddl('procedures', proc_name)
                     dest_ddl = get_dest_ddl('procedures', proc_name)
                     
-                    # Normalize whitespace for comparison
-                    source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                    dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                    
-                    if source_normalized != dest_normalized:
-                        sql_lines.append(f"-- Update procedure: {proc_name}")
-                        sql_lines.append(f"DROP PROCEDURE IF EXISTS `{dest_schema}`.`{proc_name}`;")
+                    if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl):
+                        yield f"-- Update procedure: {proc_name}"
+                        yield f"DROP PROCEDURE IF EXISTS `{dest_schema}`.`{proc_name}`;"
                         adapted_ddl = self._adapt_ddl_for_destination(source_ddl, dest_schema)
-                        sql_lines.append(adapted_ddl)
-                        sql_lines.append("")
+                        yield adapted_ddl
+                        yield ""
                 except Exception:
-                    sql_lines.append(f"-- ERROR: Failed to process procedure {proc_name}")
+                    yield f"-- ERROR: Failed to process procedure {proc_name}"
         
         # Process function changes
         if 'functions' in comparison:
@@ -562,49 +567,45 @@ class SchemaComparator:
                 functions_comparison.get('only_in_dest') or 
                 functions_comparison.get('in_both')):
                 
-                sql_lines.extend([
+                yield from [
                     "",
                     "-- FUNCTIONS CHANGES", 
                     "--" + "-" * 48
-                ])
+                ]
                 
                 # Functions only in source (to be created)
-                for func_name in sorted(functions_comparison.get('only_in_source', [])):
+                for func_name in functions_comparison.get('only_in_source', []):
                     try:
                         source_ddl = get_source_ddl('functions', func_name)
                         if source_ddl:
-                            sql_lines.append(f"-- Create function: {func_name}")
-                            sql_lines.append(f"DROP FUNCTION IF EXISTS `{dest_schema}`.`{func_name}`;")
+                            yield f"-- Create function: {func_name}"
+                            yield f"DROP FUNCTION IF EXISTS `{dest_schema}`.`{func_name}`;"
                             adapted_ddl = self._adapt_ddl_for_destination(source_ddl, dest_schema)
-                            sql_lines.append(adapted_ddl)
-                            sql_lines.append("")
+                            yield adapted_ddl
+                            yield ""
                     except Exception:
-                        sql_lines.append(f"-- ERROR: Failed to process function {func_name}")
+                        yield f"-- ERROR: Failed to process function {func_name}"
                 
                 # Functions only in dest (to be dropped)
-                for func_name in sorted(functions_comparison.get('only_in_dest', [])):
-                    sql_lines.append(f"-- Drop function: {func_name}")
-                    sql_lines.append(f"DROP FUNCTION IF EXISTS `{dest_schema}`.`{func_name}`;")
-                    sql_lines.append("")
+                for func_name in functions_comparison.get('only_in_dest', []):
+                    yield f"-- Drop function: {func_name}"
+                    yield f"DROP FUNCTION IF EXISTS `{dest_schema}`.`{func_name}`;"
+                    yield ""
                 
                 # Functions in both (to be updated)
-                for func_name in sorted(functions_comparison.get('in_both', [])):
+                for func_name in functions_comparison.get('in_both', []):
                     try:
                         source_ddl = get_source_ddl('functions', func_name)
                         dest_ddl = get_dest_ddl('functions', func_name)
                         
-                        # Normalize whitespace for comparison
-                        source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                        dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                        
-                        if source_normalized != dest_normalized:
-                            sql_lines.append(f"-- Update function: {func_name}")
-                            sql_lines.append(f"DROP FUNCTION IF EXISTS `{dest_schema}`.`{func_name}`;")
+                        if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl):
+                            yield f"-- Update function: {func_name}"
+                            yield f"DROP FUNCTION IF EXISTS `{dest_schema}`.`{func_name}`;"
                             adapted_ddl = self._adapt_ddl_for_destination(source_ddl, dest_schema)
-                            sql_lines.append(adapted_ddl)
-                            sql_lines.append("")
+                            yield adapted_ddl
+                            yield ""
                     except Exception:
-                        sql_lines.append(f"-- ERROR: Failed to process function {func_name}")
+                        yield f"-- ERROR: Failed to process function {func_name}"
         
         # Process trigger changes
         if 'triggers' in comparison:
@@ -613,49 +614,45 @@ class SchemaComparator:
                 triggers_comparison.get('only_in_dest') or 
                 triggers_comparison.get('in_both')):
                 
-                sql_lines.extend([
+                yield from [
                     "",
                     "-- TRIGGERS CHANGES", 
                     "--" + "-" * 48
-                ])
+                ]
                 
                 # Triggers only in source (to be created)
-                for trigger_name in sorted(triggers_comparison.get('only_in_source', [])):
+                for trigger_name in triggers_comparison.get('only_in_source', []):
                     try:
                         source_ddl = get_source_ddl('triggers', trigger_name)
                         if source_ddl:
-                            sql_lines.append(f"-- Create trigger: {trigger_name}")
-                            sql_lines.append(f"DROP TRIGGER IF EXISTS `{dest_schema}`.`{trigger_name}`;")
+                            yield f"-- Create trigger: {trigger_name}"
+                            yield f"DROP TRIGGER IF EXISTS `{dest_schema}`.`{trigger_name}`;"
                             adapted_ddl = self._adapt_ddl_for_destination(source_ddl, dest_schema)
-                            sql_lines.append(adapted_ddl)
-                            sql_lines.append("")
+                            yield adapted_ddl
+                            yield ""
                     except Exception:
-                        sql_lines.append(f"-- ERROR: Failed to process trigger {trigger_name}")
+                        yield f"-- ERROR: Failed to process trigger {trigger_name}"
                 
                 # Triggers only in dest (to be dropped)
-                for trigger_name in sorted(triggers_comparison.get('only_in_dest', [])):
-                    sql_lines.append(f"-- Drop trigger: {trigger_name}")
-                    sql_lines.append(f"DROP TRIGGER IF EXISTS `{dest_schema}`.`{trigger_name}`;")
-                    sql_lines.append("")
+                for trigger_name in triggers_comparison.get('only_in_dest', []):
+                    yield f"-- Drop trigger: {trigger_name}"
+                    yield f"DROP TRIGGER IF EXISTS `{dest_schema}`.`{trigger_name}`;"
+                    yield ""
                 
                 # Triggers in both (to be updated)
-                for trigger_name in sorted(triggers_comparison.get('in_both', [])):
+                for trigger_name in triggers_comparison.get('in_both', []):
                     try:
                         source_ddl = get_source_ddl('triggers', trigger_name)
                         dest_ddl = get_dest_ddl('triggers', trigger_name)
                         
-                        # Normalize whitespace for comparison
-                        source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                        dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                        
-                        if source_normalized != dest_normalized:
-                            sql_lines.append(f"-- Update trigger: {trigger_name}")
-                            sql_lines.append(f"DROP TRIGGER IF EXISTS `{dest_schema}`.`{trigger_name}`;")
+                        if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl):
+                            yield f"-- Update trigger: {trigger_name}"
+                            yield f"DROP TRIGGER IF EXISTS `{dest_schema}`.`{trigger_name}`;"
                             adapted_ddl = self._adapt_ddl_for_destination(source_ddl, dest_schema)
-                            sql_lines.append(adapted_ddl)
-                            sql_lines.append("")
+                            yield adapted_ddl
+                            yield ""
                     except Exception:
-                        sql_lines.append(f"-- ERROR: Failed to process trigger {trigger_name}")
+                        yield f"-- ERROR: Failed to process trigger {trigger_name}"
         
         # Process event changes
         if 'events' in comparison:
@@ -664,49 +661,45 @@ class SchemaComparator:
                 events_comparison.get('only_in_dest') or 
                 events_comparison.get('in_both')):
                 
-                sql_lines.extend([
+                yield from [
                     "",
                     "-- EVENTS CHANGES", 
                     "--" + "-" * 48
-                ])
+                ]
                 
                 # Events only in source (to be created)
-                for event_name in sorted(events_comparison.get('only_in_source', [])):
+                for event_name in events_comparison.get('only_in_source', []):
                     try:
                         source_ddl = get_source_ddl('events', event_name)
                         if source_ddl:
-                            sql_lines.append(f"-- Create event: {event_name}")
-                            sql_lines.append(f"DROP EVENT IF EXISTS `{dest_schema}`.`{event_name}`;")
+                            yield f"-- Create event: {event_name}"
+                            yield f"DROP EVENT IF EXISTS `{dest_schema}`.`{event_name}`;"
                             adapted_ddl = self._adapt_ddl_for_destination(source_ddl, dest_schema)
-                            sql_lines.append(adapted_ddl)
-                            sql_lines.append("")
+                            yield adapted_ddl
+                            yield ""
                     except Exception:
-                        sql_lines.append(f"-- ERROR: Failed to process event {event_name}")
+                        yield f"-- ERROR: Failed to process event {event_name}"
                 
                 # Events only in dest (to be dropped)
-                for event_name in sorted(events_comparison.get('only_in_dest', [])):
-                    sql_lines.append(f"-- Drop event: {event_name}")
-                    sql_lines.append(f"DROP EVENT IF EXISTS `{dest_schema}`.`{event_name}`;")
-                    sql_lines.append("")
+                for event_name in events_comparison.get('only_in_dest', []):
+                    yield f"-- Drop event: {event_name}"
+                    yield f"DROP EVENT IF EXISTS `{dest_schema}`.`{event_name}`;"
+                    yield ""
                 
                 # Events in both (to be updated)
-                for event_name in sorted(events_comparison.get('in_both', [])):
+                for event_name in events_comparison.get('in_both', []):
                     try:
                         source_ddl = get_source_ddl('events', event_name)
                         dest_ddl = get_dest_ddl('events', event_name)
                         
-                        # Normalize whitespace for comparison
-                        source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                        dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                        
-                        if source_normalized != dest_normalized:
-                            sql_lines.append(f"-- Update event: {event_name}")
-                            sql_lines.append(f"DROP EVENT IF EXISTS `{dest_schema}`.`{event_name}`;")
+                        if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl):
+                            yield f"-- Update event: {event_name}"
+                            yield f"DROP EVENT IF EXISTS `{dest_schema}`.`{event_name}`;"
                             adapted_ddl = self._adapt_ddl_for_destination(source_ddl, dest_schema)
-                            sql_lines.append(adapted_ddl)
-                            sql_lines.append("")
+                            yield adapted_ddl
+                            yield ""
                     except Exception:
-                        sql_lines.append(f"-- ERROR: Failed to process event {event_name}")
+                        yield f"-- ERROR: Failed to process event {event_name}"
         
         # Process view changes
         if 'views' in comparison:
@@ -715,49 +708,45 @@ class SchemaComparator:
                 views_comparison.get('only_in_dest') or 
                 views_comparison.get('in_both')):
                 
-                sql_lines.extend([
+                yield from [
                     "",
                     "-- VIEWS CHANGES", 
                     "--" + "-" * 48
-                ])
+                ]
                 
                 # Views only in source (to be created)
-                for view_name in sorted(views_comparison.get('only_in_source', [])):
+                for view_name in views_comparison.get('only_in_source', []):
                     try:
                         source_ddl = get_source_ddl('views', view_name)
                         if source_ddl:
-                            sql_lines.append(f"-- Create view: {view_name}")
-                            sql_lines.append(f"DROP VIEW IF EXISTS `{dest_schema}`.`{view_name}`;")
+                            yield f"-- Create view: {view_name}"
+                            yield f"DROP VIEW IF EXISTS `{dest_schema}`.`{view_name}`;"
                             adapted_ddl = self._adapt_ddl_for_destination(source_ddl, dest_schema)
-                            sql_lines.append(adapted_ddl)
-                            sql_lines.append("")
+                            yield adapted_ddl
+                            yield ""
                     except Exception:
-                        sql_lines.append(f"-- ERROR: Failed to process view {view_name}")
+                        yield f"-- ERROR: Failed to process view {view_name}"
                 
                 # Views only in dest (to be dropped)
-                for view_name in sorted(views_comparison.get('only_in_dest', [])):
-                    sql_lines.append(f"-- Drop view: {view_name}")
-                    sql_lines.append(f"DROP VIEW IF EXISTS `{dest_schema}`.`{view_name}`;")
-                    sql_lines.append("")
+                for view_name in views_comparison.get('only_in_dest', []):
+                    yield f"-- Drop view: {view_name}"
+                    yield f"DROP VIEW IF EXISTS `{dest_schema}`.`{view_name}`;"
+                    yield ""
                 
                 # Views in both (to be updated)
-                for view_name in sorted(views_comparison.get('in_both', [])):
+                for view_name in views_comparison.get('in_both', []):
                     try:
                         source_ddl = get_source_ddl('views', view_name)
                         dest_ddl = get_dest_ddl('views', view_name)
                         
-                        # Normalize whitespace for comparison
-                        source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                        dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                        
-                        if source_normalized != dest_normalized:
-                            sql_lines.append(f"-- Update view: {view_name}")
-                            sql_lines.append(f"DROP VIEW IF EXISTS `{dest_schema}`.`{view_name}`;")
+                        if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl):
+                            yield f"-- Update view: {view_name}"
+                            yield f"DROP VIEW IF EXISTS `{dest_schema}`.`{view_name}`;"
                             adapted_ddl = self._adapt_ddl_for_destination(source_ddl, dest_schema)
-                            sql_lines.append(adapted_ddl)
-                            sql_lines.append("")
+                            yield adapted_ddl
+                            yield ""
                     except Exception:
-                        sql_lines.append(f"-- ERROR: Failed to process view {view_name}")
+                        yield f"-- ERROR: Failed to process view {view_name}"
         
         # Process sequence changes
         if 'sequences' in comparison:
@@ -766,58 +755,52 @@ class SchemaComparator:
                 sequences_comparison.get('only_in_dest') or 
                 sequences_comparison.get('in_both')):
                 
-                sql_lines.extend([
+                yield from [
                     "",
                     "-- SEQUENCES CHANGES", 
                     "--" + "-" * 48
-                ])
+                ]
                 
                 # Sequences only in source (to be created)
-                for sequence_name in sorted(sequences_comparison.get('only_in_source', [])):
+                for sequence_name in sequences_comparison.get('only_in_source', []):
                     try:
                         source_ddl = get_source_ddl('sequences', sequence_name)
                         if source_ddl:
-                            sql_lines.append(f"-- Create sequence: {sequence_name}")
-                            sql_lines.append(f"DROP SEQUENCE IF EXISTS `{dest_schema}`.`{sequence_name}`;")
+                            yield f"-- Create sequence: {sequence_name}"
+                            yield f"DROP SEQUENCE IF EXISTS `{dest_schema}`.`{sequence_name}`;"
                             adapted_ddl = self._adapt_ddl_for_destination(source_ddl, dest_schema)
-                            sql_lines.append(adapted_ddl)
-                            sql_lines.append("")
+                            yield adapted_ddl
+                            yield ""
                     except Exception:
-                        sql_lines.append(f"-- ERROR: Failed to process sequence {sequence_name}")
+                        yield f"-- ERROR: Failed to process sequence {sequence_name}"
                 
                 # Sequences only in dest (to be dropped)
-                for sequence_name in sorted(sequences_comparison.get('only_in_dest', [])):
-                    sql_lines.append(f"-- Drop sequence: {sequence_name}")
-                    sql_lines.append(f"DROP SEQUENCE IF EXISTS `{dest_schema}`.`{sequence_name}`;")
-                    sql_lines.append("")
+                for sequence_name in sequences_comparison.get('only_in_dest', []):
+                    yield f"-- Drop sequence: {sequence_name}"
+                    yield f"DROP SEQUENCE IF EXISTS `{dest_schema}`.`{sequence_name}`;"
+                    yield ""
                 
                 # Sequences in both (to be updated)
-                for sequence_name in sorted(sequences_comparison.get('in_both', [])):
+                for sequence_name in sequences_comparison.get('in_both', []):
                     try:
                         source_ddl = get_source_ddl('sequences', sequence_name)
                         dest_ddl = get_dest_ddl('sequences', sequence_name)
                         
-                        # Normalize whitespace for comparison
-                        source_normalized = ' '.join(source_ddl.split()) if source_ddl else ''
-                        dest_normalized = ' '.join(dest_ddl.split()) if dest_ddl else ''
-                        
-                        if source_normalized != dest_normalized:
-                            sql_lines.append(f"-- Update sequence: {sequence_name}")
-                            sql_lines.append(f"DROP SEQUENCE IF EXISTS `{dest_schema}`.`{sequence_name}`;")
+                        if not same_ddl_ignoring_whitespace(source_ddl, dest_ddl):
+                            yield f"-- Update sequence: {sequence_name}"
+                            yield f"DROP SEQUENCE IF EXISTS `{dest_schema}`.`{sequence_name}`;"
                             adapted_ddl = self._adapt_ddl_for_destination(source_ddl, dest_schema)
-                            sql_lines.append(adapted_ddl)
-                            sql_lines.append("")
+                            yield adapted_ddl
+                            yield ""
                     except Exception:
-                        sql_lines.append(f"-- ERROR: Failed to process sequence {sequence_name}")
+                        yield f"-- ERROR: Failed to process sequence {sequence_name}"
         
-        sql_lines.extend([
+        yield from [
             "",
             "SET FOREIGN_KEY_CHECKS = 1;",
             "",
             "-- Migration script completed."
-        ])
-        
-        return '\n'.join(sql_lines)
+        ]
     
     def _compare_table_properties(self, table_name: str, source_ddl: str, dest_ddl: str) -> List[Dict[str, Any]]:
         """
@@ -907,27 +890,27 @@ class SchemaComparator:
             return properties
         
         # Clean up the DDL for parsing
-        ddl_clean = re.sub(r'\s+', ' ', ddl.strip())
+        ddl_clean = ' '.join(ddl.split())
         
         # Extract COMMENT
-        comment_match = re.search(r"COMMENT=['\"]([^'\"]*)['\"]", ddl_clean, re.IGNORECASE)
+        comment_match = _TABLE_COMMENT_RE.search(ddl_clean)
         if comment_match:
             properties['comment'] = comment_match.group(1)
         else:
             properties['comment'] = ''
         
         # Extract ENGINE
-        engine_match = re.search(r"ENGINE=(\w+)", ddl_clean, re.IGNORECASE)
+        engine_match = _ENGINE_RE.search(ddl_clean)
         if engine_match:
             properties['engine'] = engine_match.group(1)
         
         # Extract DEFAULT CHARSET
-        charset_match = re.search(r"DEFAULT\s+CHARSET=(\w+)", ddl_clean, re.IGNORECASE)
+        charset_match = _DEFAULT_CHARSET_RE.search(ddl_clean)
         if charset_match:
             properties['charset'] = charset_match.group(1)
         
         # Extract COLLATE
-        collate_match = re.search(r"COLLATE[=\s]+(\w+)", ddl_clean, re.IGNORECASE)
+        collate_match = _COLLATE_RE.search(ddl_clean)
         if collate_match:
             properties['collate'] = collate_match.group(1)
         
@@ -2,13 +2,42 @@
 Database management for DDL Wizard.
 """
 
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Optional, Dict, List, Any
 import pymysql
+from pymysql.constants import CLIENT
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent SHOW CREATE connections per database
+DDL_FETCH_WORKERS = 8
+
+# Idle connections kept per DatabaseManager; enough for every DDL fetch worker
+DEFAULT_POOL_SIZE = DDL_FETCH_WORKERS
+
+# Objects whose SHOW CREATE statements are sent in one round trip
+DDL_BATCH_SIZE = 50
+
+# Object type -> (SHOW CREATE keyword, index of the DDL column in its result)
+_SHOW_CREATE = {
+    'tables': ('TABLE', 1),
+    'views': ('VIEW', 1),
+    'procedures': ('PROCEDURE', 2),
+    'functions': ('FUNCTION', 2),
+    'triggers': ('TRIGGER', 2),
+    'events': ('EVENT', 3),
+    'sequences': ('SEQUENCE', 1)
+}
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote an identifier with backticks, escaping embedded backticks."""
+    return '`' + name.replace('`', '``') + '`'
+
 
 @dataclass
 class DatabaseConfig:
@@ -28,10 +57,18 @@ class DatabaseConfig:
 class DatabaseManager:
     """Database connection and query manager."""
     
-    def __init__(self, config: DatabaseConfig):
-        """Initialize with database configuration."""
+    def __init__(self, config: DatabaseConfig, pool_size: int = DEFAULT_POOL_SIZE):
+        """
+        Initialize with database configuration.
+        
+        Args:
+            config: Database connection configuration
+            pool_size: Maximum number of idle connections kept for reuse
+        """
         self.config = config
         self.connection = None
+        # Idle connections handed out by _get_connection(); LIFO keeps the warmest on top
+        self._pool = queue.LifoQueue(maxsize=pool_size)
     
     def test_connection(self) -> bool:
         """Test database connection."""
@@ -45,8 +82,62 @@ class DatabaseManager:
             logger.error(f"Database connection test failed: {e}")
             return False
     
+    @contextmanager
     def _get_connection(self):
-        """Get database connection."""
+        """
+        Borrow a pooled database connection for the duration of a with block.
+        
+        The connection goes back to the pool when the block exits normally and
+        is closed if the block raises. Use _connect() instead for statements
+        that change session state.
+        """
+        conn = self._acquire_connection()
+        try:
+            yield conn
+        except BaseException:
+            self._close_quietly(conn)
+            raise
+        
+        try:
+            # End the implicit transaction so the next borrower sees current metadata
+            conn.rollback()
+            self._pool.put_nowait(conn)
+        except Exception:
+            self._close_quietly(conn)
+    
+    def _acquire_connection(self):
+        """Take a live connection from the pool, or open a new one."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            
+            try:
+                conn.ping(reconnect=False)
+                return conn
+            except Exception:
+                self._close_quietly(conn)
+    
+    @staticmethod
+    def _close_quietly(conn):
+        """Close a connection, ignoring errors from an already broken one."""
+        try:
+            conn.close()
+        except Exception:
+            pass
+    
+    def close(self):
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return
+            self._close_quietly(conn)
+    
+    def _connect(self, **options):
+        """Open a new database connection (options are passed to pymysql.connect)."""
         return pymysql.connect(
             host=self.config.host,
             port=self.config.port,
@@ -54,11 +145,18 @@ class DatabaseManager:
             password=self.config.password,
             database=self.config.schema,
             charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
+            cursorclass=pymysql.cursors.DictCursor,
+            **options
         )
     
     def get_all_objects_with_ddl(self) -> Dict[str, List[Dict]]:
-        """Get all database objects with their DDL."""
+        """
+        Get all database objects with their DDL.
+        
+        Object names are listed over a single connection; the SHOW CREATE
+        statements are then sent in batches of DDL_BATCH_SIZE, several batches
+        in parallel.
+        """
         objects = {
             'tables': [],
             'views': [],
@@ -68,103 +166,105 @@ class DatabaseManager:
             'events': [],
             'sequences': []
         }
+        names = {object_type: [] for object_type in objects}
         
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cursor:
-                    # Get tables (excluding views) with DDL
+                    # Get tables (excluding views)
                     cursor.execute(f"SHOW FULL TABLES FROM `{self.config.schema}` WHERE Table_type = 'BASE TABLE'")
-                    tables = cursor.fetchall()
-                    for table in tables:
-                        table_name = list(table.values())[0]
-                        try:
-                            ddl = self.get_table_ddl(table_name)
-                            objects['tables'].append({'name': table_name, 'ddl': ddl})
-                        except Exception as e:
-                            print(f"Warning: Failed to get DDL for table {table_name}: {e}")
-                            objects['tables'].append({'name': table_name, 'ddl': ''})
+                    names['tables'] = [list(table.values())[0] for table in cursor.fetchall()]
                     
-                    # Get views with DDL
+                    # Get views
                     cursor.execute(f"SHOW FULL TABLES FROM `{self.config.schema}` WHERE Table_type = 'VIEW'")
-                    views = cursor.fetchall()
-                    for view in views:
-                        view_name = list(view.values())[0]
-                        try:
-                            ddl = self.get_view_ddl(view_name)
-                            objects['views'].append({'name': view_name, 'ddl': ddl})
-                        except Exception as e:
-                            print(f"Warning: Failed to get DDL for view {view_name}: {e}")
-                            objects['views'].append({'name': view_name, 'ddl': ''})
+                    names['views'] = [list(view.values())[0] for view in cursor.fetchall()]
                     
-                    # Get sequences (MariaDB 10.3+) with DDL
+                    # Get sequences (MariaDB 10.3+)
                     try:
                         cursor.execute(f"SHOW FULL TABLES FROM `{self.config.schema}` WHERE Table_type = 'SEQUENCE'")
-                        sequences = cursor.fetchall()
-                        for seq in sequences:
-                            seq_name = list(seq.values())[0]
-                            try:
-                                ddl = self.get_sequence_ddl(seq_name)
-                                objects['sequences'].append({'name': seq_name, 'ddl': ddl})
-                            except Exception as e:
-                                print(f"Warning: Failed to get DDL for sequence {seq_name}: {e}")
-                                objects['sequences'].append({'name': seq_name, 'ddl': ''})
+                        names['sequences'] = [list(seq.values())[0] for seq in cursor.fetchall()]
                     except Exception:
                         # Sequences not supported in this MariaDB version
-                        objects['sequences'] = []
+                        names['sequences'] = []
                     
-                    # Get procedures with DDL
+                    # Get procedures
                     cursor.execute(f"SHOW PROCEDURE STATUS WHERE Db = '{self.config.schema}'")
-                    procedures = cursor.fetchall()
-                    for proc in procedures:
-                        proc_name = proc['Name']
-                        try:
-                            ddl = self.get_procedure_ddl(proc_name)
-                            objects['procedures'].append({'name': proc_name, 'ddl': ddl})
-                        except Exception as e:
-                            print(f"Warning: Failed to get DDL for procedure {proc_name}: {e}")
-                            objects['procedures'].append({'name': proc_name, 'ddl': ''})
+                    names['procedures'] = [proc['Name'] for proc in cursor.fetchall()]
                     
-                    # Get functions with DDL
+                    # Get functions
                     cursor.execute(f"SHOW FUNCTION STATUS WHERE Db = '{self.config.schema}'")
-                    functions = cursor.fetchall()
-                    for func in functions:
-                        func_name = func['Name']
-                        try:
-                            ddl = self.get_function_ddl(func_name)
-                            objects['functions'].append({'name': func_name, 'ddl': ddl})
-                        except Exception as e:
-                            print(f"Warning: Failed to get DDL for function {func_name}: {e}")
-                            objects['functions'].append({'name': func_name, 'ddl': ''})
+                    names['functions'] = [func['Name'] for func in cursor.fetchall()]
                     
-                    # Get triggers with DDL
+                    # Get triggers
                     cursor.execute(f"SHOW TRIGGERS FROM `{self.config.schema}`")
-                    triggers = cursor.fetchall()
-                    for trigger in triggers:
-                        trigger_name = trigger['Trigger']
-                        try:
-                            ddl = self.get_trigger_ddl(trigger_name)
-                            objects['triggers'].append({'name': trigger_name, 'ddl': ddl})
-                        except Exception as e:
-                            print(f"Warning: Failed to get DDL for trigger {trigger_name}: {e}")
-                            objects['triggers'].append({'name': trigger_name, 'ddl': ''})
+                    names['triggers'] = [trigger['Trigger'] for trigger in cursor.fetchall()]
                     
-                    # Get events with DDL
+                    # Get events
                     cursor.execute(f"SHOW EVENTS FROM `{self.config.schema}`")
-                    events = cursor.fetchall()
-                    for event in events:
-                        event_name = event['Name']
-                        try:
-                            ddl = self.get_event_ddl(event_name)
-                            objects['events'].append({'name': event_name, 'ddl': ddl})
-                        except Exception as e:
-                            print(f"Warning: Failed to get DDL for event {event_name}: {e}")
-                            objects['events'].append({'name': event_name, 'ddl': ''})
+                    names['events'] = [event['Name'] for event in cursor.fetchall()]
                     
         except Exception as e:
             logger.error(f"Failed to get database objects: {e}")
+        
+        # Fetch DDL for everything listed so far in batches, keeping the listing order
+        batches = [
+            (object_type, type_names[i:i + DDL_BATCH_SIZE])
+            for object_type, type_names in names.items()
+            for i in range(0, len(type_names), DDL_BATCH_SIZE)
+        ]
+        if batches:
+            with ThreadPoolExecutor(max_workers=min(DDL_FETCH_WORKERS, len(batches))) as executor:
+                for (object_type, batch_names), ddls in zip(batches, executor.map(self._fetch_ddl_batch, batches)):
+                    objects[object_type].extend(
+                        {'name': object_name, 'ddl': ddl} for object_name, ddl in zip(batch_names, ddls)
+                    )
             
         return objects
     
+    def _fetch_ddl_batch(self, batch) -> List[str]:
+        """
+        Fetch DDL for several objects of one type in a single round trip.
+        
+        The SHOW CREATE statements are sent together over a dedicated
+        multi-statement connection. Objects the batch could not return (for
+        example one dropped in the meantime aborts the rest) are fetched
+        individually with the usual per-object error handling.
+        
+        Args:
+            batch: Tuple of (object type, object names)
+            
+        Returns:
+            List[str]: DDL for each name, '' where it could not be retrieved
+        """
+        object_type, object_names = batch
+        keyword, ddl_column = _SHOW_CREATE[object_type]
+        schema = _quote_identifier(self.config.schema)
+        sql = ';'.join(
+            f"SHOW CREATE {keyword} {schema}.{_quote_identifier(name)}" for name in object_names
+        )
+        
+        ddls = []
+        try:
+            with self._connect(client_flag=CLIENT.MULTI_STATEMENTS) as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(sql)
+                    while True:
+                        result = cursor.fetchone()
+                        ddls.append(list(result.values())[ddl_column] if result else '')
+                        if len(ddls) == len(object_names) or not cursor.nextset():
+                            break
+        except Exception as e:
+            logger.debug(f"Batched DDL fetch stopped after {len(ddls)} of {len(object_names)} {object_type}: {e}")
+        
+        getter = getattr(self, f"get_{object_type[:-1]}_ddl")
+        for object_name in object_names[len(ddls):]:
+            try:
+                ddls.append(getter(object_name))
+            except Exception as e:
+                logger.warning(f"Failed to get DDL for {object_type[:-1]} {object_name}: {e}")
+                ddls.append('')
+        return ddls
+    
     def get_table_ddl(self, table_name: str) -> str:
         """Get DDL for a table."""
         try:
@@ -301,7 +401,7 @@ class DatabaseManager:
                 return results
             
             # Execute statements
-            with self._get_connection() as conn:
+            with self._connect() as conn:
                 with conn.cursor() as cursor:
                     for i, statement in enumerate(statements, 1):
                         try:
@@ -376,7 +476,7 @@ class DatabaseManager:
                 return results
             
             # Execute statement
-            with self._get_connection() as conn:
+            with self._connect() as conn:
                 with conn.cursor() as cursor:
                     logger.debug(f"Executing: {sql_statement[:100]}...")
                     cursor.execute(sql_statement)
@@ -63,14 +63,11 @@ class DependencyManager:
         Returns:
             List of rollback operations
         """
-        rollback_operations = []
-        
         # Reverse the operations and create rollback statements
-        for operation in reversed(operations):
-            rollback_op = {
+        return [
+            {
                 'type': f"ROLLBACK_{operation.get('type', 'UNKNOWN')}",
                 'sql': f"-- Rollback for {operation.get('type', 'unknown operation')}"
             }
-            rollback_operations.append(rollback_op)
-        
-        return rollback_operations
+            for operation in reversed(operations)
+        ]
@@ -18,13 +18,16 @@ class AlterStatementGenerator:
         """
         self.dest_schema = dest_schema
     
-    def generate_rollback_statements(self, table_name: str, differences: List[Dict[str, Any]]) -> List[str]:
+    def generate_rollback_statements(self, table_name: str, differences: List[Dict[str, Any]],
+                                     dest_table_ddl: str = '') -> List[str]:
         """
         Generate rollback statements for table differences.
         
         Args:
             table_name: Name of the table
             differences: List of differences found
+            dest_table_ddl: DDL of the destination table (unused, accepted for callers of the
+                top-level generator such as generate_detailed_rollback_sql)
             
         Returns:
             List of rollback SQL statements
@@ -53,6 +56,11 @@ class AlterStatementGenerator:
                 rollback_statements.append(f"ALTER TABLE `{table_name}` DROP INDEX `{diff.get('index_name')}`")
             elif diff_type == ChangeType.REMOVE_INDEX.value:
                 rollback_statements.append(f"ALTER TABLE `{table_name}` ADD {diff.get('index_definition', '')}")
+            elif diff_type == ChangeType.MODIFY_INDEX.value:
+                # To rollback modifying an index, we drop it and restore the original
+                original_def = diff.get('original_definition', '')
+                rollback_statements.append(f"ALTER TABLE `{table_name}` DROP INDEX `{diff.get('index_name')}`")
+                rollback_statements.append(f"ALTER TABLE `{table_name}` ADD {original_def}")
             elif diff_type == ChangeType.ADD_CONSTRAINT.value:
                 # To rollback adding a constraint, we drop it
                 constraint_name = diff.get('constraint_name', '')
@@ -123,6 +131,12 @@ class AlterStatementGenerator:
                 report_lines.append(f"  {i}. Index ADDED: {diff.get('index_name', 'unknown')}")
             elif diff_type == ChangeType.REMOVE_INDEX.value:
                 report_lines.append(f"  {i}. Index REMOVED: {diff.get('index_name', 'unknown')}")
+            elif diff_type == ChangeType.MODIFY_INDEX.value:
+                report_lines.append(f"  {i}. Index MODIFIED: {diff.get('index_name', 'unknown')}")
+                if diff.get('original_definition'):
+                    report_lines.append(f"      FROM: {diff['original_definition']}")
+                if diff.get('new_definition'):
+                    report_lines.append(f"      TO:   {diff['new_definition']}")
             elif diff_type == ChangeType.ADD_CONSTRAINT.value:
                 report_lines.append(f"  {i}. Foreign Key ADDED: {diff.get('constraint_name', 'unknown')}")
             elif diff_type == ChangeType.REMOVE_CONSTRAINT.value:
@@ -172,7 +186,9 @@ class AlterStatementGenerator:
             if diff_type == ChangeType.REMOVE_CONSTRAINT.value:
                 constraint_name = diff.get('constraint_name', '')
                 alter_statements.append(f"ALTER TABLE `{table_name}` DROP FOREIGN KEY IF EXISTS `{constraint_name}`")
-            elif diff_type == ChangeType.REMOVE_INDEX.value:
+            elif diff_type in (ChangeType.REMOVE_INDEX.value, ChangeType.MODIFY_INDEX.value):
+                # Indexes cannot be altered in place, so a modified index is dropped here
+                # and recreated with its new definition in phase 4
                 idx_name = diff.get('index_name', '')
                 alter_statements.append(f"ALTER TABLE `{table_name}` DROP INDEX IF EXISTS `{idx_name}`")
         
@@ -212,6 +228,9 @@ class AlterStatementGenerator:
             elif diff_type == ChangeType.ADD_INDEX.value:
                 idx_def = diff.get('index_definition', '')
                 alter_statements.append(f"ALTER TABLE `{table_name}` ADD {idx_def}")
+            elif diff_type == ChangeType.MODIFY_INDEX.value:
+                idx_def = diff.get('new_definition', '') or diff.get('index_definition', '')
+                alter_statements.append(f"ALTER TABLE `{table_name}` ADD {idx_def}")
             elif diff_type == ChangeType.ADD_CONSTRAINT.value:
                 constraint_def = diff.get('constraint_definition', '')
                 alter_statements.append(f"ALTER TABLE `{table_name}` ADD {constraint_def}")
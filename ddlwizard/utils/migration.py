@@ -6,6 +6,7 @@ Tracks applied migrations, rollback scripts, and migration metadata.
 import json
 import sqlite3
 import logging
+from contextlib import closing
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -42,15 +43,52 @@ class MigrationHistory:
     """Manages migration history and tracking."""
     
     def __init__(self, history_db_path: str = ".ddl_wizard_history.db"):
-        self.db_path = Path(history_db_path)
+        # ':memory:' keeps the whole history in RAM (dry-runs, tests); a single
+        # connection is held open because every new connection would start empty
+        if history_db_path == ":memory:":
+            self.db_path = history_db_path
+            self._conn = sqlite3.connect(history_db_path)
+        else:
+            self.db_path = Path(history_db_path)
+            self._conn = None
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection to use for a history operation."""
+        if self._conn is not None:
+            return self._conn
+        conn = sqlite3.connect(self.db_path)
+        # With WAL, NORMAL only syncs at checkpoints instead of on every commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    def snapshot(self, path: str):
+        """Copy the current history database to a file on disk (persists a ':memory:' history)."""
+        source = self._connect()
+        try:
+            with closing(sqlite3.connect(path)) as destination:
+                source.backup(destination)
+            logger.info(f"Migration history snapshot written to {path}")
+        
+        except Exception as e:
+            logger.error(f"Failed to snapshot migration history: {e}")
+            raise
+        
+        finally:
+            if source is not self._conn:
+                source.close()
+    
     def _init_database(self):
         """Initialize the migration history database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
+                # Write-ahead logging is persistent, so it is only set on a database file
+                # not already using it; readers no longer block on a migration being recorded
+                if self._conn is None and cursor.execute("PRAGMA journal_mode").fetchone()[0] != 'wal':
+                    cursor.execute("PRAGMA journal_mode=WAL")
+                
                 # Create migrations table
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS migrations (
@@ -106,7 +144,7 @@ class MigrationHistory:
                        safety_warnings: int = 0, git_commit: str = "") -> int:
         """Start tracking a new migration."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -135,7 +173,7 @@ class MigrationHistory:
                           successful_operations: int, failed_operations: int, notes: str = ""):
         """Complete migration tracking."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -156,7 +194,7 @@ class MigrationHistory:
                         execution_time: float = 0.0, error_message: str = ""):
         """Record individual operation execution."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -174,10 +212,40 @@ class MigrationHistory:
         except Exception as e:
             logger.error(f"Failed to record operation: {e}")
     
+    def record_operations(self, migration_id: int, operations: List[Dict[str, Any]]):
+        """
+        Record several executed operations in one transaction.
+        
+        Args:
+            migration_id: Migration the operations belong to
+            operations: Operation dicts with operation_type, table_name and sql_statement,
+                and optionally operation_order, status, execution_time and error_message
+        """
+        try:
+            with self._connect() as conn:
+                conn.executemany("""
+                    INSERT INTO migration_operations (
+                        migration_id, operation_order, operation_type, table_name,
+                        sql_statement, status, execution_time, error_message
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    (
+                        migration_id, op.get('operation_order', order), op.get('operation_type', ''),
+                        op.get('table_name', ''), op.get('sql_statement', ''), op.get('status', 'SUCCESS'),
+                        op.get('execution_time', 0.0), op.get('error_message', '')
+                    )
+                    for order, op in enumerate(operations, 1)
+                ))
+                
+                conn.commit()
+        
+        except Exception as e:
+            logger.error(f"Failed to record operations: {e}")
+    
     def get_migration_history(self, limit: int = 50) -> List[MigrationRecord]:
         """Get migration history."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -209,7 +277,7 @@ class MigrationHistory:
     def get_migration_details(self, migration_id: int) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific migration."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Get migration record
@@ -269,7 +337,7 @@ class MigrationHistory:
     def mark_migration_rolled_back(self, migration_id: int, rollback_notes: str = ""):
         """Mark a migration as rolled back."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -313,7 +381,7 @@ class MigrationHistory:
         try:
             cutoff_date = (datetime.now() - timedelta(days=days_to_keep)).isoformat()
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Delete old operation records first (foreign key constraint)
@@ -338,7 +406,7 @@ class MigrationHistory:
     def get_statistics(self) -> Dict[str, Any]:
         """Get migration statistics."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Total migrations
@@ -3,24 +3,76 @@ Safety analyzer for DDL Wizard.
 Detects potentially dangerous operations and data loss scenarios.
 """
 
+import functools
+import io
 import logging
+import re
+import sys
+from collections import defaultdict
 from typing import List, Dict, Any, Set, Tuple
-from enum import Enum
+from enum import IntEnum
 from dataclasses import dataclass
 from ddl_analyzer import ChangeType, ColumnDefinition, TableStructure
 
 logger = logging.getLogger(__name__)
 
+# Size specification in a column type, e.g. the 255 in varchar(255)
+_SIZE_RE = re.compile(r'\((\d+)\)')
 
-class RiskLevel(Enum):
-    """Risk levels for database operations."""
-    LOW = "LOW"
-    MEDIUM = "MEDIUM"
-    HIGH = "HIGH"
-    CRITICAL = "CRITICAL"
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
+# Character set conversions that may not be able to represent existing data
+LOSSY_CHARSET_CONVERSIONS = frozenset({
+    ('utf8mb4', 'utf8'),
+    ('utf8mb4', 'latin1'),
+    ('utf8', 'latin1')
+})
 
-@dataclass
+
+@functools.lru_cache(maxsize=512)
+def _extract_size(type_str: str):
+    """Extract the size specification from a column type, or None."""
+    match = _SIZE_RE.search(type_str)
+    return int(match.group(1)) if match else None
+
+
+class RiskLevel(IntEnum):
+    """Risk levels for database operations, ordered by severity."""
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+    
+    def __str__(self):
+        return self.name
+
+
+_RISK_EMOJI = {
+    RiskLevel.LOW: "🟢",
+    RiskLevel.MEDIUM: "🟡",
+    RiskLevel.HIGH: "🟠",
+    RiskLevel.CRITICAL: "🔴"
+}
+
+# Known storage engine conversions: (from, to) -> (risk level, risk factors)
+_ENGINE_CHANGE_RISKS = {
+    ('INNODB', 'MYISAM'): (RiskLevel.HIGH, (
+        "Loss of transaction support",
+        "Loss of foreign key constraints",
+        "Loss of crash recovery"
+    )),
+    ('MYISAM', 'INNODB'): (RiskLevel.MEDIUM, (
+        "Table will be locked during conversion",
+        "Storage requirements may increase"
+    )),
+}
+
+# Order in which risk levels are listed in the safety report
+_REPORT_RISK_ORDER = (RiskLevel.CRITICAL, RiskLevel.HIGH, RiskLevel.MEDIUM, RiskLevel.LOW)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SafetyWarning:
     """Represents a safety warning for a database operation."""
     risk_level: RiskLevel
@@ -31,74 +83,79 @@ class SafetyWarning:
     affected_data: str = ""
     
     def __str__(self):
-        risk_emoji = {
-            RiskLevel.LOW: "🟢",
-            RiskLevel.MEDIUM: "🟡", 
-            RiskLevel.HIGH: "🟠",
-            RiskLevel.CRITICAL: "🔴"
-        }
-        
-        return f"{risk_emoji[self.risk_level]} {self.risk_level.value}: {self.description}"
+        return f"{_RISK_EMOJI[self.risk_level]} {self.risk_level.name}: {self.description}"
 
 
 class SafetyAnalyzer:
     """Analyzes database operations for potential data loss and safety issues."""
     
+    # Data types that are incompatible for conversion
+    INCOMPATIBLE_TYPES = frozenset({
+        ('varchar', 'int'),
+        ('text', 'int'),
+        ('json', 'varchar'),
+        ('datetime', 'varchar'),
+        ('decimal', 'varchar')
+    })
+    
     def __init__(self):
-        # Data types that are incompatible for conversion
-        self.incompatible_types = {
-            ('varchar', 'int'): True,
-            ('text', 'int'): True,
-            ('json', 'varchar'): True,
-            ('datetime', 'varchar'): True,
-            ('decimal', 'varchar'): True
-        }
-        
         # Operations that can cause data loss
         self.risky_operations = {
             ChangeType.DROP_COLUMN: RiskLevel.HIGH,
             ChangeType.DROP_INDEX: RiskLevel.MEDIUM,
             ChangeType.CHANGE_ENGINE: RiskLevel.MEDIUM,
         }
+        
+        # Per-change-type analyzers, each taking (table_name, diff)
+        self._handlers = {
+            ChangeType.DROP_COLUMN: self._drop_column_handler,
+            ChangeType.MODIFY_COLUMN: self._modify_column_handler,
+            ChangeType.ADD_COLUMN: self._add_column_handler,
+            ChangeType.DROP_INDEX: self._drop_index_handler,
+            ChangeType.CHANGE_ENGINE: self._engine_change_handler,
+            ChangeType.CHANGE_CHARSET: self._charset_change_handler,
+        }
+        # Change types that can produce a warning; anything else is skipped
+        self._dispatchable = frozenset(self._handlers)
     
     def analyze_migration_safety(self, table_name: str, differences: List[Dict[str, Any]], 
                                 source_structure: TableStructure, dest_structure: TableStructure) -> List[SafetyWarning]:
         """Analyze a table migration for safety issues."""
         warnings = []
+        handlers = self._handlers
+        dispatchable = self._dispatchable
         
         for diff in differences:
             change_type = diff['type']
+            if change_type not in dispatchable:
+                continue
             
-            if change_type == ChangeType.DROP_COLUMN:
-                warning = self._analyze_column_drop(table_name, diff['column'])
-                warnings.append(warning)
-            
-            elif change_type == ChangeType.MODIFY_COLUMN:
-                warning = self._analyze_column_modification(
-                    table_name, diff['column_name'], diff['from'], diff['to']
-                )
-                if warning:
-                    warnings.append(warning)
-            
-            elif change_type == ChangeType.ADD_COLUMN:
-                warning = self._analyze_column_addition(table_name, diff['column'])
-                if warning:
-                    warnings.append(warning)
-            
-            elif change_type == ChangeType.DROP_INDEX:
-                warning = self._analyze_index_drop(table_name, diff['index'])
+            warning = handlers[change_type](table_name, diff)
+            if warning:
                 warnings.append(warning)
-            
-            elif change_type == ChangeType.CHANGE_ENGINE:
-                warning = self._analyze_engine_change(table_name, diff['from'], diff['to'])
-                warnings.append(warning)
-            
-            elif change_type == ChangeType.CHANGE_CHARSET:
-                warning = self._analyze_charset_change(table_name, diff['from'], diff['to'])
-                if warning:
-                    warnings.append(warning)
         
-        return warnings
+        # Drop duplicate warnings while keeping their first-seen order
+        return list(dict.fromkeys(warnings))
+    
+    def _drop_column_handler(self, table_name: str, diff: Dict[str, Any]) -> SafetyWarning:
+        return self._analyze_column_drop(table_name, diff['column'])
+    
+    def _modify_column_handler(self, table_name: str, diff: Dict[str, Any]) -> SafetyWarning:
+        return self._analyze_column_modification(
+            table_name, diff['column_name'], diff['from'], diff['to']
+        )
+    
+    def _add_column_handler(self, table_name: str, diff: Dict[str, Any]) -> SafetyWarning:
+        return self._analyze_column_addition(table_name, diff['column'])
+    
+    def _drop_index_handler(self, table_name: str, diff: Dict[str, Any]) -> SafetyWarning:
+        return self._analyze_index_drop(table_name, diff['index'])
+    
+    def _engine_change_handler(self, table_name: str, diff: Dict[str, Any]) -> SafetyWarning:
+        return self._analyze_engine_change(table_name, diff['from'], diff['to'])
+    
+    def _charset_change_handler(self, table_name: str, diff: Dict[str, Any]) -> SafetyWarning:
+        return self._analyze_charset_change(table_name, diff['from'], diff['to'])
     
     def _analyze_column_drop(self, table_name: str, column: ColumnDefinition) -> SafetyWarning:
         """Analyze column drop operation."""
@@ -192,20 +249,10 @@ class SafetyAnalyzer:
     
     def _analyze_engine_change(self, table_name: str, from_engine: str, to_engine: str) -> SafetyWarning:
         """Analyze storage engine change."""
-        risk_factors = []
-        risk_level = RiskLevel.MEDIUM
-        
         # Specific engine change risks
-        if from_engine.upper() == 'INNODB' and to_engine.upper() == 'MYISAM':
-            risk_level = RiskLevel.HIGH
-            risk_factors.append("Loss of transaction support")
-            risk_factors.append("Loss of foreign key constraints")
-            risk_factors.append("Loss of crash recovery")
-        
-        elif from_engine.upper() == 'MYISAM' and to_engine.upper() == 'INNODB':
-            risk_level = RiskLevel.MEDIUM
-            risk_factors.append("Table will be locked during conversion")
-            risk_factors.append("Storage requirements may increase")
+        risk_level, risk_factors = _ENGINE_CHANGE_RISKS.get(
+            (from_engine.upper(), to_engine.upper()), (RiskLevel.MEDIUM, ())
+        )
         
         description = f"Changing storage engine from {from_engine} to {to_engine}"
         if risk_factors:
@@ -223,13 +270,7 @@ class SafetyAnalyzer:
     def _analyze_charset_change(self, table_name: str, from_charset: str, to_charset: str) -> SafetyWarning:
         """Analyze character set change."""
         # Check for potentially lossy charset conversions
-        lossy_conversions = [
-            ('utf8mb4', 'utf8'),
-            ('utf8mb4', 'latin1'),
-            ('utf8', 'latin1')
-        ]
-        
-        if (from_charset, to_charset) in lossy_conversions:
+        if (from_charset, to_charset) in LOSSY_CHARSET_CONVERSIONS:
             return SafetyWarning(
                 risk_level=RiskLevel.HIGH,
                 operation="CHANGE CHARSET",
@@ -241,7 +282,9 @@ class SafetyAnalyzer:
         
         return None
     
-    def _extract_base_type(self, data_type: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _extract_base_type(data_type: str) -> str:
         """Extract base data type from full type definition."""
         # Remove size specifications and return base type
         base_type = data_type.lower().split('(')[0]
@@ -249,18 +292,13 @@ class SafetyAnalyzer:
     
     def _are_types_incompatible(self, from_type: str, to_type: str) -> bool:
         """Check if two data types are incompatible for conversion."""
-        return (from_type, to_type) in self.incompatible_types
+        return (from_type, to_type) in self.INCOMPATIBLE_TYPES
     
     def _is_size_reduction(self, from_type: str, to_type: str) -> bool:
         """Check if type change involves size reduction."""
         # Extract sizes from varchar, char, etc.
-        def extract_size(type_str):
-            import re
-            match = re.search(r'\((\d+)\)', type_str)
-            return int(match.group(1)) if match else None
-        
-        from_size = extract_size(from_type)
-        to_size = extract_size(to_type)
+        from_size = _extract_size(from_type)
+        to_size = _extract_size(to_type)
         
         if from_size and to_size:
             return to_size < from_size
@@ -283,46 +321,45 @@ class SafetyAnalyzer:
         if not warnings:
             return "✅ No safety issues detected. Migration appears safe to execute."
         
-        report_lines = [
-            "🛡️  DDL Wizard Safety Analysis Report",
-            "=" * 50,
-            ""
-        ]
+        buffer = io.StringIO()
+        write = buffer.write
+        write("🛡️  DDL Wizard Safety Analysis Report\n")
+        write("=" * 50)
+        write("\n\n")
         
         # Group by risk level
-        by_risk = {}
+        by_risk = defaultdict(list)
         for warning in warnings:
-            if warning.risk_level not in by_risk:
-                by_risk[warning.risk_level] = []
             by_risk[warning.risk_level].append(warning)
         
         # Report in order of severity
-        for risk_level in [RiskLevel.CRITICAL, RiskLevel.HIGH, RiskLevel.MEDIUM, RiskLevel.LOW]:
+        for risk_level in _REPORT_RISK_ORDER:
             if risk_level in by_risk:
-                report_lines.append(f"{risk_level.value} RISK OPERATIONS:")
-                report_lines.append("-" * 30)
+                write(f"{risk_level.name} RISK OPERATIONS:\n{'-' * 30}\n")
                 
                 for warning in by_risk[risk_level]:
-                    report_lines.append(f"Table: {warning.table_name}")
-                    report_lines.append(f"Operation: {warning.operation}")
-                    report_lines.append(f"Issue: {warning.description}")
-                    report_lines.append(f"Recommendation: {warning.recommendation}")
+                    write(
+                        f"Table: {warning.table_name}\n"
+                        f"Operation: {warning.operation}\n"
+                        f"Issue: {warning.description}\n"
+                        f"Recommendation: {warning.recommendation}\n"
+                    )
                     if warning.affected_data:
-                        report_lines.append(f"Affected Data: {warning.affected_data}")
-                    report_lines.append("")
+                        write(f"Affected Data: {warning.affected_data}\n")
+                    write("\n")
         
         # Summary
-        critical_count = len(by_risk.get(RiskLevel.CRITICAL, []))
-        high_count = len(by_risk.get(RiskLevel.HIGH, []))
+        critical_count = len(by_risk[RiskLevel.CRITICAL])
+        high_count = len(by_risk[RiskLevel.HIGH])
         
-        report_lines.append("SUMMARY:")
-        report_lines.append(f"Total warnings: {len(warnings)}")
-        report_lines.append(f"Critical issues: {critical_count}")
-        report_lines.append(f"High risk issues: {high_count}")
+        write(
+            f"SUMMARY:\n"
+            f"Total warnings: {len(warnings)}\n"
+            f"Critical issues: {critical_count}\n"
+            f"High risk issues: {high_count}"
+        )
         
         if critical_count > 0:
-            report_lines.append("")
-            report_lines.append("⚠️  CRITICAL ISSUES DETECTED!")
-            report_lines.append("Review all critical issues before proceeding.")
+            write("\n\n⚠️  CRITICAL ISSUES DETECTED!\nReview all critical issues before proceeding.")
         
-        return "\n".join(report_lines)
+        return buffer.getvalue()
@@ -55,6 +55,12 @@ class GitManager:
             
             file_path = object_dir / f"{object_name}.sql"
             
+            # Leave unchanged objects alone so their files (and the git index) stay
+            # untouched; only the timestamp in the header would differ otherwise
+            if self._has_same_ddl(file_path, ddl):
+                logger.debug(f"{object_type} DDL unchanged: {file_path}")
+                return True
+            
             # Add header comment with metadata
             from datetime import datetime
             content = f"""-- {object_type.upper()}: {object_name}
@@ -72,6 +78,16 @@ class GitManager:
             logger.error(f"Failed to save DDL for {object_type}/{object_name}: {e}")
             return False
     
+    @staticmethod
+    def _has_same_ddl(file_path: Path, ddl: str) -> bool:
+        """Check whether a saved DDL file already holds this DDL below its header."""
+        try:
+            content = file_path.read_text(encoding='utf-8')
+        except (FileNotFoundError, UnicodeDecodeError):
+            return False
+        header, separator, body = content.partition("\n\n")
+        return bool(separator) and body == f"{ddl}\n"
+    
     def save_all_objects(self, objects_data: Dict[str, List[Dict]], get_ddl_func) -> bool:
         """Save DDL for all database objects."""
         try:
@@ -21,9 +21,13 @@ Interactive mode manager for DDL Wizard.
 """
 
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# Answers accepted as confirmation
+_YES = frozenset({'y', 'yes'})
+
 
 class InteractiveModeManager:
     """Manages interactive user prompts and confirmations."""
@@ -46,19 +50,27 @@ class InteractiveModeManager:
         Returns:
             bool: True if user confirms, False otherwise
         """
-        print(f"\n📋 Migration Summary:")
-        print(f"   Source: {source_schema}")
-        print(f"   Destination: {dest_schema}")
-        print(f"   Operations: {operation_count}")
-        print(f"   Warnings: {len(safety_warnings)}")
-        
+        lines = [
+            "\n📋 Migration Summary:",
+            f"   Source: {source_schema}",
+            f"   Destination: {dest_schema}",
+            f"   Operations: {operation_count}",
+            f"   Warnings: {len(safety_warnings)}"
+        ]
         if safety_warnings:
-            print(f"\n⚠️ Safety Warnings:")
-            for warning in safety_warnings:
-                print(f"   - {warning.level.value}: {warning.message}")
+            lines.append("\n⚠️ Safety Warnings:")
+            lines.extend(f"   - {warning.risk_level.name}: {warning.description}" for warning in safety_warnings)
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+        
+        # Nobody can answer the prompt when stdin is piped or closed
+        if not sys.stdin.isatty():
+            logger.info("Standard input is not a terminal, declining migration")
+            return False
         
-        response = input(f"\n❓ Do you want to proceed with this migration? (y/N): ").strip().lower()
-        return response in ['y', 'yes']
+        response = self._prompt("\n❓ Do you want to proceed with this migration? (y/N): ")
+        return response in _YES
     
     def prompt_for_confirmation(self, message: str) -> bool:
         """
@@ -70,5 +82,28 @@ class InteractiveModeManager:
         Returns:
             bool: True if user confirms, False otherwise
         """
-        response = input(f"{message} (y/N): ").strip().lower()
-        return response in ['y', 'yes']
+        response = self._prompt(f"{message} (y/N): ")
+        return response in _YES
+    
+    def _prompt(self, prompt: str) -> str:
+        """
+        Write a prompt and read one normalized answer from stdin.
+        
+        Reads the line directly instead of going through input(), which
+        flushes both standard streams on every call.
+        
+        Args:
+            prompt: Prompt text to display
+            
+        Returns:
+            str: Stripped, lower-cased answer
+            
+        Raises:
+            EOFError: If stdin is exhausted, as input() would
+        """
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip().lower()
@@ -0,0 +1,168 @@
+"""
+Tests for table DDL parsing and diffing in both schema comparator copies
+"""
+import io
+
+import pytest
+
+import schema_comparator
+from ddlwizard.utils import comparator as package_comparator
+
+
+@pytest.fixture(params=[schema_comparator, package_comparator], ids=['root', 'package'])
+def comparator_module(request):
+    """The root and the packaged comparator module"""
+    return request.param
+
+
+TABLE_DDL = """CREATE TABLE `orders` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `customer_id` int(11) NOT NULL,
+  `status` varchar(20) DEFAULT 'new',
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `uk_status` (`status`),
+  KEY `idx_customer` (`customer_id`),
+  CONSTRAINT `fk_customer` FOREIGN KEY (`customer_id`) REFERENCES `customers` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"""
+
+
+def test_parse_table(comparator_module):
+    """Columns, indexes and foreign keys are split out of a CREATE TABLE statement"""
+    columns, indexes, foreign_keys = comparator_module.SchemaComparator._parse_table(TABLE_DDL)
+
+    assert list(columns) == ['id', 'customer_id', 'status']
+    assert columns['status'] == "varchar(20) DEFAULT 'new'"
+    assert indexes == {
+        'uk_status': "UNIQUE KEY `uk_status` (`status`)",
+        'idx_customer': "KEY `idx_customer` (`customer_id`)",
+    }
+    assert foreign_keys == {
+        'fk_customer': "CONSTRAINT `fk_customer` FOREIGN KEY (`customer_id`) "
+                       "REFERENCES `customers` (`id`) ON DELETE CASCADE"
+    }
+
+
+def test_same_ddl_ignoring_whitespace(comparator_module):
+    """Stored-object DDL differing only in whitespace compares equal"""
+    same_ddl = comparator_module.same_ddl_ignoring_whitespace
+
+    assert same_ddl("CREATE PROCEDURE p()\nBEGIN\n  SELECT 1;\nEND", "CREATE PROCEDURE p() BEGIN SELECT 1; END")
+    assert same_ddl(None, '')
+    assert not same_ddl("SELECT 1", "SELECT 2")
+    assert comparator_module._ddl_tokens.cache_info().maxsize == 1024
+
+
+def test_table_clause_classifier(comparator_module):
+    """Each clause kind is reported as the last matched group"""
+    match = comparator_module._TABLE_CLAUSE_RE.match
+
+    assert match("CONSTRAINT `fk` FOREIGN KEY (`a`) REFERENCES `t` (`id`)").lastgroup == 'foreign_key'
+    assert match("FOREIGN KEY `fk` (`a`) REFERENCES `t` (`id`)").lastgroup == 'foreign_key'
+    assert match("CONSTRAINT `chk` CHECK (`a` > 0)").lastgroup == 'clause'
+    for clause in ("PRIMARY KEY (`id`)", "UNIQUE KEY `u` (`a`)", "KEY `k` (`a`)", "INDEX `i` (`a`)"):
+        assert match(clause).lastgroup == 'clause'
+
+    column = match("`customer_id` int(11) NOT NULL")
+    assert column.lastgroup == 'column'
+    assert column.group(4) == 'customer_id'
+    assert column.group(5) == 'int(11) NOT NULL'
+
+
+def test_table_clause_classifier_spatial_and_fulltext_keys():
+    """The root comparator treats SPATIAL and FULLTEXT keys as key clauses, not columns"""
+    match = schema_comparator._TABLE_CLAUSE_RE.match
+
+    assert match("SPATIAL KEY `sp_location` (`location`)").lastgroup == 'clause'
+    assert match("SPATIAL INDEX `sp_location` (`location`)").lastgroup == 'clause'
+    assert match("FULLTEXT KEY `ft_body` (`body`)").lastgroup == 'clause'
+
+
+def test_parse_table_spatial_key():
+    """SPATIAL keys are parsed as indexes by the root comparator"""
+    ddl = """CREATE TABLE `places` (
+  `id` int(11) NOT NULL,
+  `location` point NOT NULL,
+  PRIMARY KEY (`id`),
+  SPATIAL KEY `sp_location` (`location`)
+) ENGINE=InnoDB"""
+    columns, indexes, _ = schema_comparator.SchemaComparator._parse_table(ddl)
+
+    assert list(columns) == ['id', 'location']
+    assert indexes == {'sp_location': "SPATIAL KEY `sp_location` (`location`)"}
+
+
+def test_analyze_table_differences_detects_index_modification(comparator_module):
+    """An index whose definition changed is reported as modified, not added or removed"""
+    comparator = comparator_module.SchemaComparator()
+    source_ddl = TABLE_DDL.replace("KEY `idx_customer` (`customer_id`)", "KEY `idx_customer` (`customer_id`,`status`)")
+
+    differences = comparator.analyze_table_differences('orders', source_ddl, TABLE_DDL)
+
+    assert [diff['type'] for diff in differences] == [comparator_module.ChangeType.MODIFY_INDEX.value]
+    diff = differences[0]
+    assert diff['index_name'] == 'idx_customer'
+    assert diff['original_definition'] == "KEY `idx_customer` (`customer_id`)"
+    assert diff['new_definition'] == "KEY `idx_customer` (`customer_id`,`status`)"
+
+
+def test_analyze_table_differences_added_and_removed_members(comparator_module):
+    """Members present on one side only are reported as added or removed"""
+    comparator = comparator_module.SchemaComparator()
+    source_ddl = TABLE_DDL.replace("  KEY `idx_customer` (`customer_id`),\n", "").replace(
+        "  `status` varchar(20) DEFAULT 'new',\n",
+        "  `status` varchar(20) DEFAULT 'new',\n  `note` text,\n"
+    )
+
+    differences = comparator.analyze_table_differences('orders', source_ddl, TABLE_DDL)
+
+    change_type = comparator_module.ChangeType
+    assert [(diff['type'], diff.get('column_name') or diff.get('index_name')) for diff in differences] == [
+        (change_type.ADD_COLUMN.value, 'note'),
+        (change_type.REMOVE_INDEX.value, 'idx_customer'),
+    ]
+
+
+def test_analyze_table_differences_identical_ddl(comparator_module):
+    """Identical DDL has no differences"""
+    comparator = comparator_module.SchemaComparator()
+
+    assert comparator.analyze_table_differences('orders', TABLE_DDL, TABLE_DDL) == []
+
+
+def test_write_migration_sql_matches_generated_script(comparator_module):
+    """Streaming the migration script writes the generated script line by line"""
+    comparator = comparator_module.SchemaComparator()
+    source_ddl = TABLE_DDL.replace("KEY `idx_customer` (`customer_id`)", "KEY `idx_customer` (`customer_id`,`status`)")
+    ddl = {'source': {('tables', 'orders'): source_ddl, ('tables', 'invoices'): "CREATE TABLE `invoices` (`id` int)"},
+           'dest': {('tables', 'orders'): TABLE_DDL}}
+    comparison = comparator.compare_objects(
+        {'tables': [{'name': 'orders'}, {'name': 'invoices'}]},
+        {'tables': [{'name': 'orders'}]}
+    )
+    args = (comparison, lambda *key: ddl['source'].get(key, ''), lambda *key: ddl['dest'].get(key, ''), 'shop', 'shop_copy')
+
+    fp = io.StringIO()
+    comparator.write_migration_sql(fp, *args)
+
+    def without_timestamp(sql):
+        return [line for line in sql.split("\n") if not line.startswith("-- Generated:")]
+
+    assert without_timestamp(fp.getvalue()) == without_timestamp(comparator.generate_migration_sql(*args) + "\n")
+    assert "CREATE TABLE `invoices` (`id` int)" in fp.getvalue()
+
+
+@pytest.mark.parametrize('col_def, expected', [
+    ("varchar(50) CHARACTER SET utf8mb4 COLLATE utf8mb4_general_ci NOT NULL", "varchar(50) NOT NULL"),
+    ("varchar(50) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci NOT NULL", "varchar(50) NOT NULL"),
+    ("varchar(50) CHARACTER SET utf8mb4 NOT NULL", "varchar(50) NOT NULL"),
+    ("varchar(50) COLLATE utf8mb4_general_ci DEFAULT NULL", "varchar(50) DEFAULT NULL"),
+    ("varchar(50)  character  set  utf8mb4   DEFAULT NULL", "varchar(50) DEFAULT NULL"),
+    # A non-default collation is significant and kept along with its charset
+    ("varchar(50) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL",
+     "varchar(50) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL"),
+    ("varchar(50) CHARACTER SET latin1 NOT NULL", "varchar(50) CHARACTER SET latin1 NOT NULL"),
+    ("varchar(50) CHARACTER SET utf8mb4x NOT NULL", "varchar(50) CHARACTER SET utf8mb4x NOT NULL"),
+])
+def test_normalize_column_definition_default_utf8mb4(col_def, expected):
+    """Default utf8mb4 charset and collation clauses are removed in one pass"""
+    assert schema_comparator.SchemaComparator._normalize_column_definition(col_def) == expected
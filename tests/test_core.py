@@ -0,0 +1,195 @@
+"""
+Tests for schema fingerprinting and the identical-schema shortcut in the core
+"""
+import pytest
+
+from ddlwizard.core import DDLWizardCore, run_complete_migration
+from ddlwizard.utils.config import DatabaseConnection, DDLWizardConfig, OutputSettings, SafetySettings
+from ddlwizard.utils.database import DatabaseConfig
+from ddlwizard.utils.dependencies import DependencyManager
+from ddlwizard.utils.generator import AlterStatementGenerator
+
+
+SOURCE_CONFIG = DatabaseConfig('localhost', 3306, 'user', 'secret', 'shop')
+DEST_CONFIG = DatabaseConfig('localhost', 3307, 'user', 'secret', 'shop_copy')
+
+
+def make_objects(orders_ddl="CREATE TABLE `orders` (`id` int)"):
+    """Schema objects as returned by DatabaseManager.get_all_objects_with_ddl()"""
+    return {
+        'tables': [
+            {'name': 'orders', 'ddl': orders_ddl},
+            {'name': 'customers', 'ddl': "CREATE TABLE `customers` (`id` int)"},
+        ],
+        'views': [{'name': 'v_orders', 'ddl': "CREATE VIEW `v_orders` AS SELECT 1"}],
+    }
+
+
+@pytest.fixture
+def config():
+    """Minimal DDL Wizard configuration"""
+    connection = DatabaseConnection('localhost', 3306, 'user', 'secret', 'shop')
+    return DDLWizardConfig(connection, connection, SafetySettings(), OutputSettings())
+
+
+@pytest.fixture
+def core(config, tmp_path, monkeypatch):
+    """Core whose migration history database lives in a temporary directory"""
+    monkeypatch.chdir(tmp_path)
+    return DDLWizardCore(config)
+
+
+def test_schema_fingerprints_ignore_object_order(core):
+    """Fingerprints depend on object names and DDL, not on listing order"""
+    source_objects = make_objects()
+    dest_objects = {object_type: list(reversed(objects)) for object_type, objects in make_objects().items()}
+
+    source_fingerprint, dest_fingerprint = core.schema_fingerprints(source_objects, dest_objects)
+
+    assert source_fingerprint == dest_fingerprint
+
+
+def test_schema_fingerprints_differ_on_ddl(core):
+    """A DDL change anywhere in the schema changes its fingerprint"""
+    source_objects = make_objects("CREATE TABLE `orders` (`id` bigint)")
+
+    source_fingerprint, dest_fingerprint = core.schema_fingerprints(source_objects, make_objects())
+
+    assert source_fingerprint != dest_fingerprint
+
+
+@pytest.mark.parametrize('source_ddl, expect_shortcut', [
+    ("CREATE TABLE `orders` (`id` int)", True),
+    ("CREATE TABLE `orders` (`id` bigint)", False),
+])
+def test_run_complete_migration_identical_schema_shortcut(config, tmp_path, monkeypatch, source_ddl, expect_shortcut):
+    """Identical schemas give the SQL generators no common objects, but the report the full comparison"""
+    monkeypatch.chdir(tmp_path)
+    calls = {}
+
+    def record(name, result=None, position=0):
+        def method(self, *args):
+            calls[name] = args[position]
+            return result
+        return method
+
+    monkeypatch.setattr(DDLWizardCore, 'connect_databases', lambda self, source, dest: True)
+    monkeypatch.setattr(DDLWizardCore, 'initialize_git_repository', lambda self, output_dir: True)
+    monkeypatch.setattr(DDLWizardCore, 'extract_schema_objects',
+                        lambda self: (make_objects(source_ddl), make_objects()))
+    monkeypatch.setattr(DDLWizardCore, 'write_migration_sql', record('migration', position=1))
+    monkeypatch.setattr(DDLWizardCore, 'write_rollback_sql', record('rollback', position=1))
+    monkeypatch.setattr(DDLWizardCore, 'generate_migration_report', record('report', {'detailed_changes': []}))
+    monkeypatch.setattr(DDLWizardCore, 'write_migration_report', lambda self, report_data, output_dir: 'report.md')
+    monkeypatch.setattr(DDLWizardCore, 'record_migration_history', lambda self, *args: 1)
+
+    result = run_complete_migration(SOURCE_CONFIG, DEST_CONFIG, config, str(tmp_path), skip_safety_checks=True)
+
+    comparison = result['comparison']
+    assert sorted(comparison['tables']['in_both']) == ['customers', 'orders']
+    assert calls['report'] is comparison
+    for name in ('migration', 'rollback'):
+        changes = calls[name]
+        if expect_shortcut:
+            assert all(object_comparison['in_both'] == [] for object_comparison in changes.values())
+            assert {object_type: {**object_comparison, 'in_both': []}
+                    for object_type, object_comparison in comparison.items()} == changes
+        else:
+            assert changes is comparison
+
+
+def test_write_sql_scripts_stream_to_files(core, tmp_path):
+    """Migration and rollback scripts are written to their files one line at a time"""
+    from ddl_wizard import generate_detailed_rollback_sql
+
+    def without_timestamp(lines):
+        return [line for line in lines if not line.startswith("-- Generated:")]
+
+    source_objects = make_objects("CREATE TABLE `orders` (`id` bigint)")
+    source_objects['tables'].append({'name': 'invoices', 'ddl': "CREATE TABLE `invoices` (`id` int)"})
+    dest_objects = make_objects()
+    core._seed_ddl_cache(core._source_ddl_cache, source_objects)
+    core._seed_ddl_cache(core._dest_ddl_cache, dest_objects)
+    core.dependency_manager = DependencyManager()
+    comparison = core.compare_schemas(source_objects, dest_objects)
+    migration_file = tmp_path / 'migration.sql'
+    rollback_file = tmp_path / 'rollback.sql'
+
+    core.write_migration_sql(migration_file, comparison, SOURCE_CONFIG, DEST_CONFIG)
+    core.write_rollback_sql(rollback_file, comparison, source_objects, dest_objects)
+
+    migration_sql = core.comparator.generate_migration_sql(
+        comparison, core._get_source_ddl, core._get_dest_ddl, 'shop', 'shop_copy'
+    )
+    assert migration_file.read_text().endswith("\n")
+    assert without_timestamp(migration_file.read_text().splitlines()) == without_timestamp(migration_sql.split("\n"))
+    assert "CREATE TABLE `invoices` (`id` int)" in migration_sql
+
+    rollback_lines = generate_detailed_rollback_sql(
+        comparison, source_objects, dest_objects, core.alter_generator, core._get_source_ddl, core._get_dest_ddl
+    )
+    assert without_timestamp(rollback_file.read_text().splitlines()) == without_timestamp(rollback_lines)
+
+
+def test_background_visualization_renders_in_spawned_process(core, tmp_path):
+    """Background documentation is rendered by a spawned process from plain schema data"""
+    process = core.generate_schema_visualization(make_objects(), str(tmp_path), background=True)
+    process.join()
+
+    assert process.exitcode == 0
+    assert (tmp_path / "documentation" / "schema_documentation.html").exists()
+
+
+def test_record_migration_history_records_operations(core):
+    """Each detailed change of the report is stored as an operation of the migration"""
+    detailed_changes = [
+        {'type': 'TABLE', 'object_type': 'table', 'object_name': 'invoices', 'operation': 'CREATE',
+         'sql': "CREATE TABLE invoices"},
+        {'type': 'TABLE', 'object_type': 'table', 'object_name': 'orders', 'operation': 'MODIFY',
+         'sql': "ALTER TABLE orders"},
+    ]
+
+    migration_id = core.record_migration_history('shop_to_shop_copy', SOURCE_CONFIG, DEST_CONFIG, 2,
+                                                 'migration.sql', 'rollback.sql', 0, detailed_changes)
+
+    operations = core.history.get_migration_details(migration_id)['operations']
+    assert [(op['order'], op['type'], op['table'], op['sql']) for op in operations] == [
+        (1, 'CREATE TABLE', 'invoices', "CREATE TABLE invoices"),
+        (2, 'MODIFY TABLE', 'orders', "ALTER TABLE orders"),
+    ]
+
+
+ORDERS_DDL = """CREATE TABLE `orders` (
+  `id` int(11) NOT NULL,
+  `customer_id` int(11) NOT NULL,
+  `status` varchar(20) DEFAULT 'new',
+  PRIMARY KEY (`id`),
+  KEY `idx_customer` (`customer_id`)
+) ENGINE=InnoDB"""
+
+
+def test_modified_index_is_dropped_and_recreated(core, tmp_path):
+    """A changed index definition is migrated and rolled back by dropping and re-adding the index"""
+    source_objects = make_objects(ORDERS_DDL.replace("(`customer_id`)", "(`customer_id`,`status`)"))
+    dest_objects = make_objects(ORDERS_DDL)
+    core._seed_ddl_cache(core._source_ddl_cache, source_objects)
+    core._seed_ddl_cache(core._dest_ddl_cache, dest_objects)
+    core.dependency_manager = DependencyManager()
+    core.alter_generator = AlterStatementGenerator('shop_copy')
+    differences = core.comparator.analyze_table_differences(
+        'orders', core._get_source_ddl('tables', 'orders'), core._get_dest_ddl('tables', 'orders')
+    )
+
+    assert core.alter_generator.generate_alter_statements('orders', differences) == [
+        "ALTER TABLE `orders` DROP INDEX IF EXISTS `idx_customer`",
+        "ALTER TABLE `orders` ADD KEY `idx_customer` (`customer_id`,`status`)",
+    ]
+    assert "Index MODIFIED: idx_customer" in core.alter_generator.generate_table_differences_report('orders', differences)
+
+    rollback_file = tmp_path / 'rollback.sql'
+    core.write_rollback_sql(rollback_file, core.compare_schemas(source_objects, dest_objects), source_objects, dest_objects)
+
+    rollback_sql = rollback_file.read_text()
+    assert "ALTER TABLE `orders` DROP INDEX `idx_customer`;" in rollback_sql
+    assert "ALTER TABLE `orders` ADD KEY `idx_customer` (`customer_id`);" in rollback_sql
+    assert "ERROR" not in rollback_sql
@@ -0,0 +1,110 @@
+"""
+Tests for batched DDL fetching in DatabaseManager, using fake connections
+"""
+import pytest
+
+from ddlwizard.utils.database import DatabaseConfig, DatabaseManager
+
+
+class FakeCursor:
+    """Cursor returning one row per result set; None marks a failing statement"""
+
+    def __init__(self, result_sets):
+        self.result_sets = result_sets
+        self.executed = []
+        self.position = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql):
+        self.executed.append(sql)
+
+    def fetchone(self):
+        return self.result_sets[self.position]
+
+    def nextset(self):
+        self.position += 1
+        if self.position >= len(self.result_sets):
+            return None
+        if self.result_sets[self.position] is None:
+            raise RuntimeError("Table 'shop.gone' doesn't exist")
+        return True
+
+
+class FakeConnection:
+    """Connection handing out a single FakeCursor"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def cursor(self):
+        return self._cursor
+
+
+def make_manager(monkeypatch, result_sets):
+    """Build a DatabaseManager whose connections all use one fake cursor"""
+    manager = DatabaseManager(DatabaseConfig('localhost', 3306, 'user', 'secret', 'shop'))
+    cursor = FakeCursor(result_sets)
+    monkeypatch.setattr(manager, '_connect', lambda **options: FakeConnection(cursor))
+    return manager, cursor
+
+
+def test_fetch_ddl_batch_single_round_trip(monkeypatch):
+    """All SHOW CREATE statements of a batch are sent together"""
+    manager, cursor = make_manager(monkeypatch, [
+        {'Table': 'a', 'Create Table': 'CREATE TABLE `a` (...)'},
+        {'Table': 'b', 'Create Table': 'CREATE TABLE `b` (...)'},
+    ])
+    monkeypatch.setattr(manager, 'get_table_ddl', lambda name: pytest.fail(f"fallback used for {name}"))
+
+    ddls = manager._fetch_ddl_batch(('tables', ['a', 'b']))
+
+    assert ddls == ['CREATE TABLE `a` (...)', 'CREATE TABLE `b` (...)']
+    assert cursor.executed == ["SHOW CREATE TABLE `shop`.`a`;SHOW CREATE TABLE `shop`.`b`"]
+
+
+def test_fetch_ddl_batch_falls_back_per_object(monkeypatch, caplog):
+    """Objects after a failed statement are fetched one at a time, failures logged"""
+    manager, _ = make_manager(monkeypatch, [
+        {'Table': 'a', 'Create Table': 'CREATE TABLE `a` (...)'},
+        None,
+        {'Table': 'c', 'Create Table': 'CREATE TABLE `c` (...)'},
+    ])
+    fetched = []
+
+    def get_table_ddl(name):
+        fetched.append(name)
+        if name == 'gone':
+            raise RuntimeError("Table 'shop.gone' doesn't exist")
+        return f"CREATE TABLE `{name}` (fetched)"
+
+    monkeypatch.setattr(manager, 'get_table_ddl', get_table_ddl)
+
+    ddls = manager._fetch_ddl_batch(('tables', ['a', 'gone', 'c']))
+
+    assert ddls == ['CREATE TABLE `a` (...)', '', 'CREATE TABLE `c` (fetched)']
+    assert fetched == ['gone', 'c']
+    assert [record.getMessage() for record in caplog.records if record.levelname == 'WARNING'] == [
+        "Failed to get DDL for table gone: Table 'shop.gone' doesn't exist"
+    ]
+
+
+def test_fetch_ddl_batch_quotes_identifiers(monkeypatch):
+    """Object names containing backticks are escaped in the batched statement"""
+    manager, cursor = make_manager(monkeypatch, [
+        {'Procedure': 'we`ird', 'sql_mode': '', 'Create Procedure': 'CREATE PROCEDURE ...'},
+    ])
+
+    assert manager._fetch_ddl_batch(('procedures', ['we`ird'])) == ['CREATE PROCEDURE ...']
+    assert cursor.executed == ["SHOW CREATE PROCEDURE `shop`.`we``ird`"]
+
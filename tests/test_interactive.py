@@ -0,0 +1,37 @@
+"""
+Tests for the interactive migration confirmation
+"""
+import pytest
+
+from ddlwizard.utils.interactive import InteractiveModeManager
+from ddlwizard.utils.safety import RiskLevel, SafetyWarning
+
+
+WARNING = SafetyWarning(
+    risk_level=RiskLevel.HIGH,
+    operation="DROP COLUMN",
+    table_name="orders",
+    description="Column 'note' will be dropped",
+    recommendation="Back up the column first"
+)
+
+
+@pytest.mark.parametrize('answer, confirmed', [('y', True), ('', False)])
+def test_confirm_migration_lists_warnings(monkeypatch, capsys, answer, confirmed):
+    """Warnings are listed by risk level and description before the prompt"""
+    manager = InteractiveModeManager()
+    monkeypatch.setattr('sys.stdin.isatty', lambda: True)
+    monkeypatch.setattr(manager, '_prompt', lambda prompt: answer)
+
+    assert manager.confirm_migration('shop', 'shop_copy', 2, [WARNING]) is confirmed
+    assert "   - HIGH: Column 'note' will be dropped\n" in capsys.readouterr().out
+
+
+def test_confirm_migration_declines_without_terminal(monkeypatch, capsys):
+    """A piped stdin declines without prompting"""
+    manager = InteractiveModeManager()
+    monkeypatch.setattr('sys.stdin.isatty', lambda: False)
+    monkeypatch.setattr(manager, '_prompt', lambda prompt: pytest.fail("prompted without a terminal"))
+
+    assert manager.confirm_migration('shop', 'shop_copy', 2, [WARNING]) is False
+    assert "Warnings: 1" in capsys.readouterr().out
@@ -0,0 +1,80 @@
+"""
+Tests for the in-memory migration history and its disk snapshots
+"""
+import sqlite3
+from contextlib import closing
+
+from ddlwizard.utils.migration import MigrationHistory
+
+
+def test_in_memory_history_keeps_schema_between_operations():
+    """Every operation of a ':memory:' history uses the same database"""
+    history = MigrationHistory(':memory:')
+
+    migration_id = history.start_migration('shop_to_shop_copy', 'shop', 'shop_copy', 3,
+                                           'migration.sql', 'rollback.sql')
+    history.complete_migration(migration_id, 'SUCCESS', 1.5, 3, 0)
+
+    records = history.get_migration_history()
+    assert [(record.id, record.status) for record in records] == [(migration_id, 'SUCCESS')]
+
+
+def test_in_memory_history_is_not_put_in_wal_mode():
+    """Journal pragmas are skipped when there is no database file"""
+    history = MigrationHistory(':memory:')
+
+    assert history._connect().execute("PRAGMA journal_mode").fetchone()[0] == 'memory'
+
+
+def test_snapshot_persists_in_memory_history(tmp_path):
+    """A snapshot copies the in-memory history to a database file"""
+    history = MigrationHistory(':memory:')
+    history.start_migration('shop_to_shop_copy', 'shop', 'shop_copy', 1, 'migration.sql', 'rollback.sql')
+    snapshot_path = tmp_path / 'history.db'
+
+    history.snapshot(str(snapshot_path))
+
+    restored = MigrationHistory(str(snapshot_path))
+    assert [record.migration_name for record in restored.get_migration_history()] == ['shop_to_shop_copy']
+    with closing(sqlite3.connect(snapshot_path)) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM migrations").fetchone()[0] == 1
+
+
+def test_record_operations_inserts_in_order():
+    """Operations recorded in one batch are numbered in the order given"""
+    history = MigrationHistory(':memory:')
+    migration_id = history.start_migration('shop_to_shop_copy', 'shop', 'shop_copy', 2, 'migration.sql', 'rollback.sql')
+
+    history.record_operations(migration_id, [
+        {'operation_type': 'CREATE TABLE', 'table_name': 'invoices', 'sql_statement': 'CREATE TABLE invoices'},
+        {'operation_type': 'MODIFY TABLE', 'table_name': 'orders', 'sql_statement': 'ALTER TABLE orders',
+         'status': 'FAILED', 'error_message': 'lock wait timeout'},
+    ])
+
+    operations = history.get_migration_details(migration_id)['operations']
+    assert [(op['order'], op['table'], op['status'], op['error']) for op in operations] == [
+        (1, 'invoices', 'SUCCESS', ''),
+        (2, 'orders', 'FAILED', 'lock wait timeout'),
+    ]
+
+
+def test_file_history_sets_wal_only_once(tmp_path, monkeypatch):
+    """Reopening a history file already in WAL mode does not switch the journal mode again"""
+    db_path = str(tmp_path / 'history.db')
+    MigrationHistory(db_path)
+    executed = []
+
+    connect = sqlite3.connect
+
+    def traced_connect(path):
+        conn = connect(path)
+        conn.set_trace_callback(executed.append)
+        return conn
+
+    monkeypatch.setattr(sqlite3, 'connect', traced_connect)
+    MigrationHistory(db_path)
+
+    assert "PRAGMA journal_mode" in executed
+    assert "PRAGMA journal_mode=WAL" not in executed
+    with closing(connect(db_path)) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
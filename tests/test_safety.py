@@ -0,0 +1,40 @@
+"""
+Tests for safety risk levels
+"""
+from ddl_analyzer import ColumnDefinition
+from ddlwizard.utils.safety import RiskLevel, SafetyAnalyzer, SafetyWarning
+
+
+def test_risk_level_ordering():
+    """Risk levels compare by severity"""
+    assert RiskLevel.LOW < RiskLevel.MEDIUM < RiskLevel.HIGH < RiskLevel.CRITICAL
+    assert max(RiskLevel.MEDIUM, RiskLevel.CRITICAL, RiskLevel.LOW) is RiskLevel.CRITICAL
+    assert sorted(RiskLevel, reverse=True) == [
+        RiskLevel.CRITICAL, RiskLevel.HIGH, RiskLevel.MEDIUM, RiskLevel.LOW
+    ]
+
+
+def test_risk_level_str():
+    """A risk level renders as its name"""
+    assert str(RiskLevel.HIGH) == "HIGH"
+    assert f"{RiskLevel.CRITICAL}" == "CRITICAL"
+
+    warning = SafetyWarning(
+        risk_level=RiskLevel.MEDIUM,
+        operation="DROP INDEX",
+        table_name="orders",
+        description="Dropping index",
+        recommendation="Check query plans"
+    )
+    assert str(warning) == "🟡 MEDIUM: Dropping index"
+
+
+def test_column_modification_escalates_to_highest_risk():
+    """Several column modification issues report the most severe risk"""
+    analyzer = SafetyAnalyzer()
+    from_col = ColumnDefinition(name='note', data_type='varchar(255)', nullable=True, default=None)
+    to_col = ColumnDefinition(name='note', data_type='varchar(50)', nullable=True, default="''")
+
+    warning = analyzer._analyze_column_modification('orders', 'note', from_col, to_col)
+
+    assert warning.risk_level is RiskLevel.HIGH